@@ -0,0 +1,38 @@
+-- V3__create_crawled_article.sql
+-- crawler 가 적재하는 수집 기사 (crawler/shared/pg_loader.py, COPY → 임시 테이블 → upsert)
+-- 예전 pg_loader 가 실행 중에 만든 테이블이 있는 DB 에서도 적용되도록 IF NOT EXISTS
+
+CREATE TABLE IF NOT EXISTS crawled_article (
+    id           VARCHAR(64) PRIMARY KEY,      -- 토픽 단위 기사 해시
+    canonical_id VARCHAR(64),                  -- 소스/토픽과 무관한 기사 ID (정규화 링크 해시)
+    source       VARCHAR(100) NOT NULL,
+    topic        VARCHAR(100),
+    title        TEXT,
+    link         VARCHAR(2000),
+    summary      TEXT,
+    content      TEXT,
+    author       VARCHAR(500),
+    published    VARCHAR(100),
+    categories   TEXT[],
+    story_id     VARCHAR(64),
+    collected_at TIMESTAMP,
+    updated_at   TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE crawled_article ADD COLUMN IF NOT EXISTS canonical_id VARCHAR(64);
+
+-- 1. 소스/토픽별 최신 기사 조회
+CREATE INDEX IF NOT EXISTS idx_crawled_article_source_collected
+    ON crawled_article (source, topic, collected_at);
+
+-- 2. 같은 기사 묶어 보기
+CREATE INDEX IF NOT EXISTS idx_crawled_article_canonical
+    ON crawled_article (canonical_id);
+
+-- 기사 소속 (같은 기사가 나온 모든 "<source>:<topic>", canonical_id 로 기사와 연결)
+CREATE TABLE IF NOT EXISTS crawled_article_topic (
+    canonical_id VARCHAR(64)  NOT NULL,
+    scope        VARCHAR(200) NOT NULL,
+    collected_at TIMESTAMP,
+    PRIMARY KEY (canonical_id, scope)
+);
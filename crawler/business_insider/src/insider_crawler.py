@@ -2,10 +2,15 @@ import os
 import time
 import requests
 from bs4 import BeautifulSoup
-from shared.utils import save_json, get_data_dir
+from shared.utils import get_data_dir
+from shared.sinks import save_articles
 from shared.logger_config import logger
 from shared.bloom_filter import BloomFilter
+from shared.article_registry import registry, canonical_id
+from shared.near_dup import near_dups
 from shared.hash_utils import generate_hash_id
+from shared.url_normalizer import canonical_url, url_key
+from shared.rate_limiter import limiter
 
 # ───────── 기본 설정
 BASE_URL = "https://www.businessinsider.com"
@@ -43,7 +48,7 @@ CYAN = "\033[96m"
 RESET = "\033[0m"
 
 # ───────── RedisBloom 초기화
-bloom = BloomFilter(host="localhost", port=6379)
+bloom = BloomFilter()  # 공용 커넥션 풀 사용, 첫 요청 시 연결
 
 
 # ───────── 페이지 요청
@@ -52,6 +57,7 @@ def fetch_page(section: str, page: int, retries: int = 3):
     headers = {"User-Agent": "Mozilla/5.0"}
     for attempt in range(1, retries + 1):
         try:
+            limiter.wait(url)
             res = requests.get(url, headers=headers, timeout=10)
             if res.status_code == 200:
                 return res.text
@@ -69,6 +75,7 @@ def parse_articles(page_html: str, topic: str):
     articles = []
     dup_count = 0
 
+    candidates = []
     for article in soup.select("article[data-component-type='tout']"):
         title_tag = article.select_one(".tout-title-link")
         summary_tag = article.select_one(".tout-copy")
@@ -83,18 +90,29 @@ def parse_articles(page_html: str, topic: str):
             continue
         if link.startswith("/"):
             link = BASE_URL + link
+        link = canonical_url(link)
 
-        # ───── BloomFilter 중복 검사
-        article_hash = generate_hash_id(link, title)
-        if not bloom.add(f"bi:{topic}", article_hash):
+        article_hash = generate_hash_id(url_key(link), title)
+        candidates.append((title, link, summary_tag, time_tag, article_hash))
+
+    # ───── BloomFilter 중복 검사 (페이지 전체를 한 번에)
+    is_new = bloom.add_many(f"bi:{topic}", [c[-1] for c in candidates])
+    # 다른 토픽/소스에서 이미 수집한 기사는 소속만 기록 (조기 중단 판단은 섹션 중복만 기준)
+    first_seen = registry.claim_many(f"bi:{topic}", [c[1] for c in candidates], is_new)
+
+    for (title, link, summary_tag, time_tag, article_hash), new, first in zip(candidates, is_new, first_seen):
+        if not new:
             dup_count += 1
             continue
+        if not first:
+            continue
 
         summary = summary_tag.get_text(strip=True) if summary_tag else ""
         read_time = time_tag.get_text(strip=True) if time_tag else ""
 
         articles.append({
             "id": article_hash,
+            "canonical_id": canonical_id(link),
             "topic": topic,
             "title": title,
             "link": link,
@@ -103,6 +121,8 @@ def parse_articles(page_html: str, topic: str):
             "collected_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
         })
 
+    # 유사 기사는 스토리로 묶고 제외 (조기 중단 판단에는 포함하지 않음)
+    articles, _ = near_dups.filter_articles(articles)
     return articles, dup_count
 
 
@@ -139,11 +159,9 @@ def crawl_section(section: str, max_pages: int = 5):
             stop_due_to_duplicates = True
             break
 
-        time.sleep(1)
-
     if all_articles:
-        save_path = os.path.join(DATA_DIR, f"{section}.json")
-        save_json(all_articles, save_path)
+        save_path = os.path.join(DATA_DIR, section)
+        save_articles(all_articles, save_path)
         logger.info(f"[{section}] {len(all_articles)}개 기사 저장 완료: {save_path}")
 
     print(f"{GREEN}✔ Success".ljust(15) + f"{', '.join(success_pages) or '-'}{RESET}")
@@ -1,159 +1,6 @@
-import os
-import json
-import time
-import feedparser
-from bs4 import BeautifulSoup
-from shared.utils import save_json, get_data_dir
-from shared.logger_config import logger
-from shared.bloom_filter import BloomFilter        # ✅ RedisBloom
-from shared.hash_utils import generate_hash_id     # ✅ 해시 ID 생성기
+from shared.rss_engine import get_source
 
-# ───────────────────────────────
-# 기본 설정
-# ───────────────────────────────
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = get_data_dir("ieee_spectrum")
-
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-BLUE = "\033[94m"
-CYAN = "\033[96m"
-RESET = "\033[0m"
-
-# ✅ RedisBloom 초기화
-bloom = BloomFilter(host="localhost", port=6379)
-bloom.ensure_filter("ieee_spectrum")
-
-# ───────────────────────────────
-# feeds.json 로드
-# ───────────────────────────────
-def load_feeds():
-    """IEEE Spectrum RSS 피드 URL 목록 로드"""
-    path = os.path.join(BASE_DIR, "../config/feeds.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-# ───────────────────────────────
-# HTML 정제
-# ───────────────────────────────
-def clean_html(raw_html: str) -> str:
-    """HTML 태그 제거 및 텍스트 정제"""
-    if not raw_html:
-        return ""
-    soup = BeautifulSoup(raw_html, "html.parser")
-    text = soup.get_text(separator=" ", strip=True)
-    return " ".join(text.split())
-
-# ───────────────────────────────
-# RSS 파싱
-# ───────────────────────────────
-def parse_feed(topic: str, url: str):
-    """IEEE Spectrum RSS 피드 파싱 + RedisBloom 중복 제거"""
-    try:
-        feed = feedparser.parse(url)
-        if not feed.entries:
-            logger.warning(f"[{topic}] RSS 피드 비어있음: {url}")
-            return [], 0
-
-        articles = []
-        duplicate_count = 0
-
-        for entry in feed.entries:
-            link = entry.get("link", "")
-            title = entry.get("title", "")
-            if not link or not title:
-                continue
-
-            # ✅ 고유 해시 생성 (link + title)
-            article_hash = generate_hash_id(link, title)
-
-            # ✅ RedisBloom 중복 체크
-            if not bloom.add(f"ieee_spectrum:{topic}", article_hash):
-                duplicate_count += 1
-                continue  # 중복 → skip
-
-            # 요약 정제
-            summary_raw = entry.get("summary", "")
-            summary_text = clean_html(summary_raw)
-
-            # 데이터 구성
-            articles.append({
-                "id": article_hash,
-                "title": title,
-                "link": link,
-                "summary": summary_text,
-                "published": entry.get("published", ""),
-                "author": entry.get("author", ""),
-                "topic": topic,
-                "collected_at": time.strftime("%Y-%m-%dT%H:%M:%S")
-            })
-
-        return articles, duplicate_count
-
-    except Exception as e:
-        logger.error(f"[{topic}] RSS 파싱 실패: {e}")
-        return [], 0
-
-# ───────────────────────────────
-# 수집 루프
-# ───────────────────────────────
-def run_cycle():
-    """IEEE Spectrum RSS 전체 수집 1회 실행"""
-    feeds = load_feeds()
-    main_feed = feeds.get("main", "")
-    topics = feeds.get("topics", {})
-
-    success_topics, empty_topics = [], []
-    duplicate_stats = {}
-
-    print(f"{BLUE}────────────────────────────────────────────{RESET}")
-    print(f"{CYAN}IEEE Spectrum Feed Parsing | {time.strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
-    print(f"{BLUE}────────────────────────────────────────────{RESET}")
-
-    # ------------------------------------------------------
-    # main 피드
-    # ------------------------------------------------------
-    try:
-        main_articles, dup_count = parse_feed("main", main_feed)
-        duplicate_stats["main"] = dup_count
-        if main_articles:
-            save_json(main_articles, os.path.join(DATA_DIR, "main.json"))
-            success_topics.append(f"main({len(main_articles)})")
-        else:
-            empty_topics.append("main")
-    except Exception as e:
-        logger.error(f"[main] 수집 실패: {e}")
-        empty_topics.append("main")
-
-    # ------------------------------------------------------
-    # 나머지 토픽 피드
-    # ------------------------------------------------------
-    for topic, url in topics.items():
-        time.sleep(1)
-        try:
-            articles, dup_count = parse_feed(topic, url)
-            duplicate_stats[topic] = dup_count
-            if articles:
-                save_json(articles, os.path.join(DATA_DIR, f"{topic}.json"))
-                success_topics.append(f"{topic}({len(articles)})")
-            else:
-                empty_topics.append(topic)
-        except Exception as e:
-            logger.error(f"[{topic}] RSS feed error: {e}")
-            empty_topics.append(topic)
-
-    # ------------------------------------------------------
-    # 결과 요약
-    # ------------------------------------------------------
-    print(f"{GREEN}✔ Success".ljust(15) + f"{', '.join(success_topics) or '-'}{RESET}")
-    print(f"{YELLOW}⚠ Empty".ljust(15) + f"{', '.join(empty_topics) or '-'}{RESET}")
-    print(f"{CYAN}🧠 Duplicates{RESET}".ljust(15))
-    for topic, count in duplicate_stats.items():
-        if count > 0:
-            print(f"   {topic}: {YELLOW}{count}{RESET} 중복 건수")
-
-    print(f"{BLUE}────────────────────────────────────────────{RESET}")
-    print(f"✅ Completed | {GREEN}{len(success_topics)} 성공{RESET} | {YELLOW}{len(empty_topics)} 실패{RESET}")
-    print(f"{BLUE}────────────────────────────────────────────{RESET}")
-
-    return {"success": success_topics, "empty": empty_topics, "duplicates": duplicate_stats}
+# 수집 로직은 shared/rss_engine.py, 필드 매핑은 shared/config/sources.json
+source = get_source("ieee_spectrum")
+parse_feed = source.parse_feed
+run_cycle = source.run_cycle
@@ -4,8 +4,8 @@ from shared.logger_config import logger
 # ───────────────────────────────────────────────
 # 모듈 import
 # ───────────────────────────────────────────────
-from mit_tech.src.mit_collector import run_cycle as run_mit
-from ieee_spectrum.src.ieee_collector import run_cycle as run_ieee
+from shared.orchestrator import discover_collectors, run_all, MAX_WORKERS
+from shared.bloom_filter import recent
 
 # ───────────────────────────────────────────────
 # 공통 설정
@@ -13,23 +13,38 @@ from ieee_spectrum.src.ieee_collector import run_cycle as run_ieee
 INTERVAL = 3600  # 1시간마다 갱신
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
+BLUE = "\033[94m"
 RESET = "\033[0m"
 
 
+def print_summary(results: list, elapsed: float):
+    """소스별 실행 결과 요약 출력"""
+    print(f"{BLUE}════════════════════════════════════════════{RESET}")
+    for r in results:
+        color = GREEN if r["status"] == "ok" else YELLOW
+        success = len(r["result"].get("success", []))
+        empty = len(r["result"].get("empty", []))
+        print(f"{color}{r['source']:<20}{r['status']:<8}{RESET} "
+              f"{success} 성공 | {empty} 실패 | {r['elapsed']}s")
+    print(f"{BLUE}════════════════════════════════════════════{RESET}")
+    print(f"⏱ Global cycle {elapsed:.1f}s ({len(results)} sources)")
+
+
 def main():
+    collectors = discover_collectors()
+    logger.info(f"{len(collectors)}개 소스 탐색 완료: {', '.join(collectors)}")
+
     while True:
         try:
             logger.info("====== 🌐 Global Crawler Cycle Start ======")
+            started = time.time()
 
-            # MIT Tech Review 수집
-            logger.info("[MIT Tech] 수집 시작")
-            run_mit()
-
-            # IEEE Spectrum 수집
-            logger.info("[IEEE Spectrum] 수집 시작")
-            run_ieee()
-
+            # 모든 소스 동시 수집 (워커 풀 크기만큼 병렬)
+            logger.info(f"{len(collectors)}개 소스 수집 시작 (workers={MAX_WORKERS})")
+            results = run_all(collectors)
 
+            print_summary(results, time.time() - started)
+            logger.info(f"로컬 중복 prefilter: {recent.stats()}")
             logger.info("====== ✅ Global Cycle Completed ======")
             print(f"{GREEN}✔ All cycles completed. Waiting for next...{RESET}")
             time.sleep(INTERVAL)
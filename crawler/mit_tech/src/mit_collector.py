@@ -2,11 +2,16 @@ import os
 import json
 import time
 from rss_parser import parse_feed
-from shared.utils import save_json, get_data_dir
+from shared.utils import get_data_dir
+from shared.sinks import save_articles
 from shared.logger_config import logger
 from topic_collector import fetch_topic
 from shared.bloom_filter import BloomFilter          # ✅ RedisBloom
+from shared.article_registry import registry, canonical_id
+from shared.near_dup import near_dups
 from shared.hash_utils import generate_hash_id       # ✅ 고유 해시 생성기
+from shared.url_normalizer import canonical_url, url_key
+from shared.fetcher import fetch_feeds, commit_feeds
 
 # ───────────────────────────────
 # 기본 설정
@@ -21,8 +26,7 @@ CYAN = "\033[96m"
 RESET = "\033[0m"
 
 # ✅ RedisBloom 초기화
-bloom = BloomFilter(host="localhost", port=6379)
-bloom.ensure_filter("mit_tech")
+bloom = BloomFilter()  # 공용 커넥션 풀 사용, 첫 요청 시 연결
 
 # ───────────────────────────────
 # feeds.json 로드
@@ -44,24 +48,34 @@ def filter_new_articles(topic: str, articles: list):
     new_articles = []
     duplicate_count = 0
 
+    # ✅ 고유 해시 생성
+    candidates = []
     for article in articles:
-        link = article.get("link", "")
+        link = article["link"] = canonical_url(article.get("link", ""))
         title = article.get("title", "")
         if not link or not title:
             continue
+        candidates.append((article, generate_hash_id(url_key(link), title)))
 
-        # ✅ 고유 해시 생성
-        article_hash = generate_hash_id(link, title)
+    # ✅ RedisBloom 중복 체크 (한 번의 호출)
+    is_new = bloom.add_many(f"mit_tech:{topic}", [h for _, h in candidates])
+    # ✅ 다른 토픽/소스에서 이미 수집한 기사는 소속 토픽만 추가
+    is_new = registry.claim_many(f"mit_tech:{topic}", [a["link"] for a, _ in candidates], is_new)
 
-        # ✅ RedisBloom 중복 체크
-        if not bloom.add(f"mit_tech:{topic}", article_hash):
+    for (article, article_hash), new in zip(candidates, is_new):
+        if not new:
             duplicate_count += 1
             continue
 
         # 해시를 id로 추가
         article["id"] = article_hash
+        article["canonical_id"] = canonical_id(article["link"])
         new_articles.append(article)
 
+    # ✅ 제목+요약이 거의 같은 기사는 하나의 스토리로 묶고 제외
+    new_articles, near_count = near_dups.filter_articles(new_articles)
+    duplicate_count += near_count
+
     return new_articles, duplicate_count
 
 # ───────────────────────────────
@@ -73,6 +87,10 @@ def run_cycle():
     success_topics, empty_topics = [], []
     duplicate_stats = {}
 
+    # RSS 피드 동시 다운로드 (파싱은 아래에서 순서대로)
+    responses = fetch_feeds([feeds["main"], *feeds["topics"].values()])
+    processed = []  # 끝까지 처리한 응답 (검증자 저장 대상)
+
     print(f"{BLUE}────────────────────────────────────────────{RESET}")
     print(f"{CYAN}MIT Tech Review Feed Parsing | {time.strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
     print(f"{BLUE}────────────────────────────────────────────{RESET}")
@@ -81,15 +99,16 @@ def run_cycle():
     # ① 메인 피드
     # ------------------------------------------------------
     try:
-        articles = parse_feed("main", feeds["main"])
+        articles = parse_feed("main", feeds["main"], responses.get(feeds["main"]))
         articles, dup_count = filter_new_articles("main", articles)
         duplicate_stats["main"] = dup_count
 
         if articles:
-            save_json(articles, os.path.join(DATA_DIR, "main.json"))
+            save_articles(articles, os.path.join(DATA_DIR, "main"))
             success_topics.append(f"main({len(articles)})")
         else:
             empty_topics.append("main")
+        processed.append(responses.get(feeds["main"]))
     except Exception as e:
         logger.error(f"[main] RSS feed error: {e}")
         empty_topics.append("main")
@@ -98,33 +117,34 @@ def run_cycle():
     # ② RSS 기반 토픽 피드
     # ------------------------------------------------------
     for topic, url in feeds["topics"].items():
-        time.sleep(1)
         try:
-            articles = parse_feed(topic, url)
+            articles = parse_feed(topic, url, responses.get(url))
             articles, dup_count = filter_new_articles(topic, articles)
             duplicate_stats[topic] = dup_count
 
             if articles:
-                save_json(articles, os.path.join(DATA_DIR, f"{topic}.json"))
+                save_articles(articles, os.path.join(DATA_DIR, topic))
                 success_topics.append(f"{topic}({len(articles)})")
             else:
                 empty_topics.append(topic)
+            processed.append(responses.get(url))
         except Exception as e:
             logger.error(f"[{topic}] RSS feed error: {e}")
             empty_topics.append(topic)
 
+    commit_feeds(processed)
+
     # ------------------------------------------------------
     # ③ API 기반 토픽 (business, climate-change)
     # ------------------------------------------------------
     for topic in ["business", "climate-change"]:
-        time.sleep(1)
         try:
             articles = fetch_topic(topic, max_pages=5)
             articles, dup_count = filter_new_articles(topic, articles)
             duplicate_stats[topic] = dup_count
 
             if articles:
-                save_json(articles, os.path.join(DATA_DIR, f"{topic}.json"))
+                save_articles(articles, os.path.join(DATA_DIR, topic))
                 success_topics.append(f"{topic}({len(articles)})")
             else:
                 empty_topics.append(topic)
@@ -1,26 +1,20 @@
 import time
-import requests
 import feedparser
 from logger_config import logger
+from shared.fetcher import fetch_feed, FeedResponse
 
 
-def parse_feed(topic: str, url: str):
-    """RSS 피드 파서"""
-    headers = {
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-        "User-Agent": "Mozilla/5.0 (MITFeedCollector/1.0)"
-    }
-
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        xml_data = response.text
-    except Exception as e:
-        logger.error(f"❌ Failed to fetch RSS: {topic} ({e})")
+def parse_feed(topic: str, url: str, response: FeedResponse = None):
+    """RSS 피드 파서 (response 가 없으면 직접 다운로드)"""
+    response = response or fetch_feed(url)
+    if response.not_modified:
+        # 지난 사이클 이후 변경 없음 → 파싱/해시/Bloom 체크 생략
+        return []
+    if not response.ok:
+        logger.error(f"❌ Failed to fetch RSS: {topic} ({response.error or response.status})")
         return []
 
-    feed = feedparser.parse(xml_data)
+    feed = feedparser.parse(response.body, response_headers=response.headers)
     articles = []
 
     for entry in feed.entries:
@@ -1,7 +1,8 @@
 import requests
-import json
 from datetime import datetime
 from logger_config import logger
+from shared.rate_limiter import limiter
+from shared.utils import atomic_write_json
 
 BASE_URL = "https://wp.technologyreview.com/wp-json/irving/v1/data/topic_feed"
 
@@ -28,6 +29,7 @@ def fetch_topic(topic: str, max_pages: int = 5):
         }
 
         try:
+            limiter.wait(BASE_URL)
             res = requests.get(BASE_URL, params=params, timeout=10)
             res.raise_for_status()
             data = res.json()
@@ -86,6 +88,5 @@ def fetch_topic(topic: str, max_pages: int = 5):
 
 def save_topic_json(topic: str, articles: list):
     path = f"../data/{topic}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=4)
+    atomic_write_json(articles, path, indent=4)
     logger.info(f"[{topic}] 저장 완료 → {path}")
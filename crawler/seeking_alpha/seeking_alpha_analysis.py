@@ -4,6 +4,7 @@ import requests
 import json
 import time
 import os
+import tempfile
 
 BASE_URL = (
     "https://seekingalpha.com/api/v3/trending/personalized/trending"
@@ -48,8 +49,26 @@ def load_existing_articles(path=FILE_PATH):
 
 
 def save_articles(articles, path=FILE_PATH):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
+    """임시 파일에 쓰고 fsync 후 rename (중간에 종료돼도 기존 파일은 그대로)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp 은 0600 으로 만들므로 기존 파일 권한(없으면 umask 적용한 기본값)으로 맞춤
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
 
 def extract_article_data(data, included_by_key):
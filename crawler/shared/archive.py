@@ -0,0 +1,135 @@
+# shared/archive.py
+"""
+완료된 JSONL 세그먼트 → 날짜/소스별 Parquet 아카이브 압축 작업.
+
+    cd crawler && python -m shared.archive
+
+archive/source=<소스>/date=<YYYY-MM-DD>/part-<시각>.parquet 형태(hive 파티션)로 쓰므로
+pyarrow.dataset / DuckDB / Spark 에서 필요한 컬럼과 기간만 읽을 수 있다.
+처리한 세그먼트는 .jsonl.archived 로 이름을 바꿔 다음 실행에서 제외한다.
+"""
+import os
+import glob
+import json
+import time
+from collections import defaultdict
+from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from shared.logger_config import logger
+from shared.segment_store import DONE_SUFFIX
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", os.path.join(PROJECT_ROOT, "archive"))
+ARCHIVED_SUFFIX = ".jsonl.archived"
+COMPRESSION = "zstd"
+
+# topic / author 는 값 종류가 적어 dictionary 인코딩 (source / date 는 파티션 경로에 포함)
+SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("canonical_id", pa.string()),
+    ("topic", pa.dictionary(pa.int32(), pa.string())),
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("summary", pa.string()),
+    ("published", pa.string()),
+    ("author", pa.dictionary(pa.int32(), pa.string())),
+    ("categories", pa.list_(pa.string())),
+    ("story_id", pa.string()),
+    ("collected_at", pa.timestamp("s")),
+])
+
+
+def _parse_time(value: str):
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(record: dict) -> dict:
+    categories = record.get("categories") or []
+    return {
+        "id": record.get("id"),
+        "canonical_id": record.get("canonical_id"),
+        "topic": record.get("topic"),
+        "title": record.get("title"),
+        "link": record.get("link"),
+        "summary": record.get("summary"),
+        "published": record.get("published"),
+        "author": record.get("author") or None,
+        "categories": [str(c) for c in categories] if isinstance(categories, list) else [str(categories)],
+        "story_id": record.get("story_id"),
+        "collected_at": _parse_time(record.get("collected_at") or record.get("fetched_at")),
+    }
+
+
+def find_segments(root: str = PROJECT_ROOT) -> dict:
+    """완료된 세그먼트 목록 → {source: [path, ...]}"""
+    segments = defaultdict(list)
+    for path in sorted(glob.glob(os.path.join(root, "*", "data", "*", f"*{DONE_SUFFIX}"))):
+        source = os.path.relpath(path, root).split(os.sep)[0]
+        if source == "shared":
+            # shared/data 는 소스가 아닌 공용 기록 (기사 소속 등)
+            continue
+        segments[source].append(path)
+    return segments
+
+
+def _read_segment(path: str) -> list:
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rows.append(_row(json.loads(line)))
+            except json.JSONDecodeError:
+                logger.warning(f"깨진 레코드 건너뜀: {path}")
+    return rows
+
+
+def _write_partitions(source: str, rows: list, archive_dir: str) -> int:
+    partitions = defaultdict(list)
+    for row in rows:
+        day = row["collected_at"].strftime("%Y-%m-%d") if row["collected_at"] else "unknown"
+        partitions[day].append(row)
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for day, part_rows in partitions.items():
+        part_dir = os.path.join(archive_dir, f"source={source}", f"date={day}")
+        os.makedirs(part_dir, exist_ok=True)
+        table = pa.Table.from_pylist(part_rows, schema=SCHEMA)
+        tmp_path = os.path.join(part_dir, f".part-{stamp}-{os.getpid()}.parquet.tmp")
+        pq.write_table(table, tmp_path, compression=COMPRESSION)
+        # 완성된 파일만 보이도록 임시 파일에 쓴 뒤 이름 변경
+        os.replace(tmp_path, os.path.join(part_dir, f"part-{stamp}-{os.getpid()}.parquet"))
+    return len(partitions)
+
+
+def compact(root: str = PROJECT_ROOT, archive_dir: str = ARCHIVE_DIR) -> dict:
+    """소스별로 세그먼트를 모아 Parquet 으로 기록 → {source: 레코드 수}"""
+    stats = {}
+    for source, paths in find_segments(root).items():
+        rows = []
+        for path in paths:
+            rows.extend(_read_segment(path))
+        if rows:
+            parts = _write_partitions(source, rows, archive_dir)
+            logger.info(f"[{source}] 세그먼트 {len(paths)}개 → 레코드 {len(rows)}개 ({parts}개 날짜 파티션)")
+        for path in paths:
+            os.replace(path, path[: -len(DONE_SUFFIX)] + ARCHIVED_SUFFIX)
+        stats[source] = len(rows)
+    return stats
+
+
+def main():
+    started = time.time()
+    stats = compact()
+    total = sum(stats.values())
+    print(f"✅ Archive | {len(stats)} sources | {total} records | {time.time() - started:.1f}s → {ARCHIVE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# shared/article_index.py
+import os
+import json
+import time
+import sqlite3
+import threading
+from shared.utils import get_data_dir
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+INDEX_PATH = os.getenv("ARTICLE_INDEX_PATH")  # 기본값: shared/data/articles.db
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id           TEXT PRIMARY KEY,
+    canonical_id TEXT,
+    source       TEXT NOT NULL,
+    topic        TEXT,
+    title        TEXT,
+    link         TEXT,
+    summary      TEXT,
+    content      TEXT,
+    author       TEXT,
+    published    TEXT,
+    categories   TEXT,
+    story_id     TEXT,
+    collected_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_collected ON articles(collected_at);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source, topic, collected_at);
+
+-- 기사 소속 (같은 기사가 나온 모든 "<source>:<topic>", canonical_id 로 articles 와 연결)
+CREATE TABLE IF NOT EXISTS article_topics (
+    canonical_id TEXT NOT NULL,
+    scope        TEXT NOT NULL,
+    collected_at TEXT,
+    PRIMARY KEY (canonical_id, scope)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content,
+    content='articles', content_rowid='rowid', tokenize='unicode61'
+);
+
+-- 본 테이블 변경 시 FTS 인덱스 동기화
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, summary, content) VALUES (new.rowid, new.title, new.summary, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.content);
+    INSERT INTO articles_fts(rowid, title, summary, content) VALUES (new.rowid, new.title, new.summary, new.content);
+END;
+"""
+
+UPSERT = """
+INSERT INTO articles (id, canonical_id, source, topic, title, link, summary, content, author, published, categories, story_id, collected_at)
+VALUES (:id, :canonical_id, :source, :topic, :title, :link, :summary, :content, :author, :published, :categories, :story_id, :collected_at)
+ON CONFLICT(id) DO UPDATE SET
+    canonical_id = excluded.canonical_id, topic = excluded.topic, title = excluded.title, link = excluded.link,
+    summary = excluded.summary, content = excluded.content, author = excluded.author,
+    published = excluded.published, categories = excluded.categories,
+    story_id = excluded.story_id, collected_at = excluded.collected_at
+"""
+
+ADD_MEMBERSHIP = """
+INSERT OR IGNORE INTO article_topics (canonical_id, scope, collected_at)
+VALUES (:canonical_id, :scope, :collected_at)
+"""
+
+
+class ArticleIndex:
+    """
+    수집 기사 로컬 인덱스 (SQLite + FTS5, 외부 서비스 불필요).
+    배치마다 하나의 트랜잭션으로 id 기준 upsert 하고,
+    title / summary / content 전문 검색을 지원한다.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path = path or INDEX_PATH or os.path.join(get_data_dir("shared"), "articles.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL: 쓰는 동안에도 다른 프로세스에서 조회 가능
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """이전 버전 DB 에 없는 컬럼 추가"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "canonical_id" not in columns:
+            self._conn.execute("ALTER TABLE articles ADD COLUMN canonical_id TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_canonical ON articles(canonical_id)")
+        self._conn.commit()
+
+    def upsert_many(self, source: str, articles: list) -> int:
+        rows = [{
+            "id": a.get("id"),
+            "canonical_id": a.get("canonical_id"),
+            "source": source,
+            "topic": a.get("topic"),
+            "title": a.get("title"),
+            "link": a.get("link"),
+            "summary": a.get("summary"),
+            "content": a.get("content"),
+            "author": a.get("author"),
+            "published": a.get("published"),
+            "categories": json.dumps(a.get("categories") or [], ensure_ascii=False),
+            "story_id": a.get("story_id"),
+            "collected_at": a.get("collected_at") or a.get("fetched_at"),
+        } for a in articles if a.get("id")]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def add_memberships(self, records: list) -> int:
+        """기사 소속 추가 (이미 있는 소속은 무시)"""
+        if not records:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(ADD_MEMBERSHIP, records)
+        return len(records)
+
+    def topics(self, canonical_id: str) -> list:
+        """기사가 수집된 소스/토픽 목록 (처음 나온 순)"""
+        sql = "SELECT scope FROM article_topics WHERE canonical_id = ? ORDER BY collected_at, scope"
+        with self._lock:
+            return [row["scope"] for row in self._conn.execute(sql, (canonical_id,))]
+
+    def search(self, query: str = None, since_hours: float = None, source: str = None, limit: int = 100) -> list:
+        """
+        조건에 맞는 기사 (최근 수집 순)
+        예: search("semiconductor", since_hours=6)
+        """
+        sql = "SELECT a.* FROM articles a"
+        where, params = [], []
+        if query:
+            sql += " JOIN articles_fts f ON f.rowid = a.rowid"
+            where.append("articles_fts MATCH ?")
+            params.append(query)
+        if since_hours is not None:
+            where.append("a.collected_at >= ?")
+            params.append(time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time() - since_hours * 3600)))
+        if source:
+            where.append("a.source = ?")
+            params.append(source)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY a.collected_at DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,87 @@
+# shared/article_registry.py
+import logging
+from shared.bloom_filter import BloomFilter, GENERATION_SECONDS, GENERATIONS
+from shared.hash_utils import generate_hash_id
+from shared.url_normalizer import url_key
+from shared.redis_pool import is_healthy
+from shared.sinks import save_memberships
+
+logger = logging.getLogger(__name__)
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+GLOBAL_KEY = "global"  # 소스/토픽 공통 Bloom 키
+MEMBERSHIP_TTL = GENERATION_SECONDS * GENERATIONS  # Bloom 세대 기간과 동일하게 유지
+
+
+def canonical_id(link: str) -> str:
+    """소스/토픽과 무관한 기사 고유 ID (정규화한 링크의 해시)"""
+    return generate_hash_id(url_key(link))
+
+
+class ArticleRegistry:
+    """
+    토픽별 중복 제거 위에 얹는 전역 중복 제거 계층.
+    같은 기사가 여러 토픽/소스에서 나오면 처음 본 곳에서만 기록을 만들고,
+    이후에는 소속("<source>:<topic>")만 추가한다.
+    소속은 저장소(JSONL/sink 의 article_topics)에 canonical id 기준으로 쌓이고,
+    최근 것은 Redis article_topics:<canonical id> 집합에서도 바로 조회할 수 있다.
+    """
+
+    def __init__(self, host=None, port=None):
+        self.host = host
+        self.port = port
+        self.bloom = BloomFilter(host, port)
+
+    def membership_key(self, article_id: str) -> str:
+        return f"article_topics:{article_id}"
+
+    def claim_many(self, scope: str, links: list, is_new: list) -> list:
+        """
+        토픽 단위로 새 기사(is_new=True)만 전역 필터에 등록
+        :param scope: 소속 이름 (토픽 Bloom 키와 동일, 예: "reuters:finance")
+        :return: 값마다 True → 전역에서 처음 본 기사 / False → 중복 또는 다른 곳에서 이미 수집
+        """
+        idx = [i for i, new in enumerate(is_new) if new]
+        if not idx:
+            return list(is_new)
+
+        ids = [canonical_id(links[i]) for i in idx]
+        first = self.bloom.add_many(GLOBAL_KEY, ids)
+        self._record_membership(scope, ids)
+        save_memberships(scope, ids)
+
+        result = [False] * len(is_new)
+        for i, f in zip(idx, first):
+            result[i] = f
+        return result
+
+    def _record_membership(self, scope: str, ids: list):
+        if not is_healthy(self.host, self.port):
+            return
+        try:
+            pipe = self.bloom.client.pipeline(transaction=False)
+            for article_id in ids:
+                key = self.membership_key(article_id)
+                pipe.sadd(key, scope)
+                pipe.expire(key, MEMBERSHIP_TTL)
+            pipe.execute()
+        except Exception as e:
+            self.bloom._on_error(e)
+            logger.warning(f"ArticleRegistry 소속 기록 실패: {e}")
+
+    def topics_of(self, link: str) -> set:
+        """기사가 수집된 소스/토픽 목록"""
+        if not is_healthy(self.host, self.port):
+            return set()
+        try:
+            return self.bloom.client.smembers(self.membership_key(canonical_id(link)))
+        except Exception as e:
+            self.bloom._on_error(e)
+            logger.warning(f"ArticleRegistry.topics_of() 실패: {e}")
+            return set()
+
+
+# 프로세스 공용 인스턴스
+registry = ArticleRegistry()
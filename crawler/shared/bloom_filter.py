@@ -1,23 +1,48 @@
 # shared/bloom_filter.py
 import os
+import time
 import logging
-from redisbloom.client import Client
+import redis
+from shared.redis_pool import get_client, is_healthy, mark_unhealthy
+from shared.local_filter import RecentHashCache
+from shared.offline_bloom import get_offline_filter
 
 logger = logging.getLogger(__name__)
 
+# ───────────────────────────────
+# 세대(generation) 설정
+# ───────────────────────────────
+GENERATION_SECONDS = int(os.getenv("BLOOM_GENERATION_HOURS", "24")) * 3600  # 세대 하나의 길이
+GENERATIONS = int(os.getenv("BLOOM_GENERATIONS", "7"))  # 중복 판정에 쓰는 세대 수 (기본 7일)
+# 세대 하나에 들어갈 값 수 (토픽 키 하나의 한 기간 분량: 새 기사 + 피드에 남아 다시 넣는 기사)
+# 넘치면 RedisBloom 이 하위 필터를 추가해 확장하므로 평소 분량 기준으로 잡는다
+GENERATION_CAPACITY = int(os.getenv("BLOOM_GENERATION_CAPACITY", "2000"))
+GENERATION_ERROR_RATE = 0.001
+
+# 프로세스 공용 로컬 prefilter (최근 본 해시는 Redis 까지 가지 않음)
+recent = RecentHashCache()
+
 class BloomFilter:
     """
     RedisBloom 기반 중복 필터 유틸.
     모든 Collector에서 공통으로 사용 가능.
+    Redis 연결은 프로세스 공용 커넥션 풀을 쓰고, 첫 명령 실행 시점에 맺는다.
+    Redis 장애 중에는 로컬 오프라인 Bloom 으로 판정하고, 복구되면 그 사이
+    추가된 값을 RedisBloom 에 다시 반영한다.
+
+    키마다 기간별 세대 필터(<key>:g<번호>)를 두고 최신 세대에만 쓴다.
+    지난 세대는 TTL 로 자동 만료되므로 Redis 메모리와 오탐률이 일정하게 유지된다.
     """
 
-    def __init__(self, host="localhost", port=6379, key_prefix="rss_seen"):
+    def __init__(self, host=None, port=None, key_prefix="rss_seen"):
         """
-        :param host: Redis 서버 호스트
-        :param port: Redis 서버 포트
+        :param host: Redis 서버 호스트 (기본값: REDIS_HOST)
+        :param port: Redis 서버 포트 (기본값: REDIS_PORT)
         :param key_prefix: 각 Collector 구분용 Prefix
         """
-        self.client = Client(host=host, port=port)
+        self.host = host
+        self.port = port
+        self.client = get_client(host, port)
         self.key_prefix = key_prefix
 
     def get_key(self, topic: str) -> str:
@@ -27,41 +52,170 @@ class BloomFilter:
         """
         return f"{self.key_prefix}:{topic}"
 
+    def is_available(self) -> bool:
+        """Redis 헬스체크 (결과는 잠시 캐시됨)"""
+        return is_healthy(self.host, self.port)
+
+    def _on_error(self, e: Exception):
+        # 연결 장애면 헬스체크 주기 동안 Redis 호출 생략
+        if isinstance(e, (redis.ConnectionError, redis.TimeoutError)):
+            mark_unhealthy(self.host, self.port)
+
+    @staticmethod
+    def generation_keys(key: str) -> list:
+        """조회할 세대 키 목록 (최신 세대부터)"""
+        current = int(time.time() // GENERATION_SECONDS)
+        return [f"{key}:g{current - i}" for i in range(GENERATIONS)]
+
+    def _recent_key(self, key: str) -> str:
+        """
+        로컬 prefilter 키 (최신 세대 기준).
+        세대가 바뀌면 prefilter 에서 빠지므로 피드에 남아 있는 기사도 한 번은
+        Redis 까지 가서 최신 세대에 다시 들어간다.
+        """
+        return self.generation_keys(key)[0]
+
+    def _queue_insert(self, pipe, key: str, values: list):
+        """
+        pipeline 에 세대 조회 + 최신 세대 추가를 적재 (실행은 호출 측에서)
+        이전 세대에 있던 값도 최신 세대에 다시 넣어, 피드에 계속 노출되는
+        기사가 세대 만료 후 새 기사로 판정되지 않도록 한다.
+        """
+        current, *older = self.generation_keys(key)
+        for gen_key in older:
+            pipe.bf().mexists(gen_key, *values)
+        # 세대 도입 전의 단일 필터도 가장 오래된 세대로 조회 (쓰지는 않음)
+        pipe.bf().mexists(key, *values)
+        pipe.bf().insert(current, values, capacity=GENERATION_CAPACITY, error=GENERATION_ERROR_RATE)
+        pipe.expire(current, GENERATION_SECONDS * GENERATIONS)
+
+    @staticmethod
+    def _merge_generations(replies: list) -> list:
+        """_queue_insert 결과 → 값마다 True(새 데이터) / False(이미 존재)"""
+        *older, inserted, _ = replies
+        return [
+            added == 1 and not any(gen[i] for gen in older)
+            for i, added in enumerate(inserted)
+        ]
+
     def exists(self, topic: str, value: str) -> bool:
         """
         값 존재 여부 확인
         """
+        key = self.get_key(topic)
+        if recent.split(self._recent_key(key), [value])[0]:
+            return True
+        if not self.is_available():
+            return get_offline_filter().contains(key, value)
         try:
-            key = self.get_key(topic)
-            return self.client.bfExists(key, value)
+            pipe = self.client.pipeline(transaction=False)
+            for gen_key in [*self.generation_keys(key), key]:
+                pipe.bf().exists(gen_key, value)
+            return any(pipe.execute())
         except Exception as e:
+            self._on_error(e)
             logger.error(f"BloomFilter.exists() 실패: {e}")
-            return False
+            return get_offline_filter().contains(key, value)
+
+    def exists_many(self, key: str, values: list) -> list:
+        """
+        여러 값의 존재 여부를 한 번의 round-trip 으로 조회 (추가하지 않음)
+        로컬 prefilter 에서 최근 본 값은 Redis 에 보내지 않는다.
+        :return: 값마다 True → 이미 존재 / False → 새 데이터
+        """
+        if not values:
+            return []
+
+        seen = recent.split(self._recent_key(key), values)
+        misses = [v for v, s in zip(values, seen) if not s]
+        if not misses:
+            return seen
+
+        offline = get_offline_filter()
+        if not self.is_available():
+            found = iter([offline.contains(key, v) for v in misses])
+            return [True if s else next(found) for s in seen]
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for gen_key in [*self.generation_keys(key), key]:
+                pipe.bf().mexists(gen_key, *misses)
+            replies = pipe.execute()
+            found = iter([any(gen[i] for gen in replies) for i in range(len(misses))])
+        except Exception as e:
+            self._on_error(e)
+            logger.error(f"BloomFilter.exists_many() 실패 → 오프라인 필터 사용: {e}")
+            found = iter([offline.contains(key, v) for v in misses])
+        return [True if s else next(found) for s in seen]
 
     def add(self, key: str, value: str) -> bool:
         """True → 새 데이터 / False → 이미 존재"""
+        return self.add_many(key, [value])[0]
+
+    def add_many(self, key: str, values: list) -> list:
+        """
+        여러 값을 한 번의 round-trip 으로 추가 (세대 조회 + 최신 세대 BF.INSERT 를 pipeline 으로)
+        로컬 prefilter 에서 최근 본 값은 Redis 에 보내지 않는다.
+        :return: 값마다 True → 새 데이터 / False → 이미 존재
+        """
+        if not values:
+            return []
+
+        recent_key = self._recent_key(key)
+        seen = recent.split(recent_key, values)
+        misses = [v for v, s in zip(values, seen) if not s]
+        if not misses:
+            return [False] * len(values)
+
+        offline = get_offline_filter()
+        if not self.is_available():
+            # 장애 중 → 로컬 판정, 새 값은 복구 후 Redis 에 반영
+            result = iter(offline.add_many(key, misses, pending=True))
+            return [False if s else next(result) for s in seen]
+
         try:
-            result = self.client.bfAdd(key, value)
-            return result == 1
+            self._reconcile(offline)
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_insert(pipe, key, misses)
+            result = iter(self._merge_generations(pipe.execute()))
         except Exception as e:
-            # 필터가 없을 수도 있으니 reserve 후 재시도
-            try:
-                self.client.bfReserve(key, 0.001, 100000)
-                result = self.client.bfAdd(key, value)
-                return result == 1
-            except Exception as e2:
-                print(f"[BloomFilter.add] 오류: {e2}")
-                return False
-
-    def ensure_filter(self, topic: str, capacity=100000, error_rate=0.001):
-        """
-        필터 존재 보장 (없으면 새로 생성)
+            self._on_error(e)
+            logger.error(f"BloomFilter.add_many() 실패 → 오프라인 필터 사용: {e}")
+            result = iter(offline.add_many(key, misses, pending=True))
+            return [False if s else next(result) for s in seen]
+
+        # 장애 대비 로컬 필터에도 같이 기록
+        offline.add_many(key, misses)
+        recent.remember(recent_key, misses)
+        return [False if s else next(result) for s in seen]
+
+    def _reconcile(self, offline):
+        """장애 중 오프라인 필터에만 들어간 값을 RedisBloom 에 반영"""
+        if not offline.has_pending():
+            return
+        grouped = offline.drain_pending()
+        if not grouped:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, values in grouped.items():
+                self._queue_insert(pipe, key, values)
+            pipe.execute()
+        except Exception:
+            offline.restore_pending(grouped)
+            raise
+        logger.info(f"오프라인 필터 동기화 완료: {sum(map(len, grouped.values()))}건 ({len(grouped)}개 키)")
+
+    def ensure_filter(self, topic: str, capacity=GENERATION_CAPACITY, error_rate=GENERATION_ERROR_RATE):
+        """
+        최신 세대 필터 존재 보장 (없으면 새로 생성)
         초기화할 때 호출하면 안전함.
         """
-        key = self.get_key(topic)
+        if not self.is_available():
+            return
+        key = self.generation_keys(self.get_key(topic))[0]
         try:
-            # 이미 존재할 경우 오류 발생하지 않음
-            self.client.bfReserve(key, error_rate, capacity)
+            self.client.bf().create(key, error_rate, capacity)
+            self.client.expire(key, GENERATION_SECONDS * GENERATIONS)
         except Exception:
             # 이미 존재하면 무시
             pass
@@ -0,0 +1,79 @@
+# shared/feed_cache.py
+import re
+import hashlib
+from shared.logger_config import logger
+from shared.hash_utils import generate_hash_id
+from shared.redis_pool import get_client, is_healthy
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+CACHE_TTL = 7 * 24 * 3600  # 7일 동안 갱신 없는 피드는 자동 만료
+
+# 요청마다 바뀌는 채널 메타데이터 (Google News 는 매번 lastBuildDate 갱신)
+VOLATILE_TAGS = re.compile(rb"<lastBuildDate>[^<]*</lastBuildDate>")
+
+
+class FeedCache:
+    """
+    피드 URL 별 HTTP 검증자(ETag / Last-Modified)와 본문 지문(body_hash) 저장소.
+    BloomFilter 와 같은 Redis 에 feed_cache:<url hash> 해시로 저장한다.
+    Redis 를 쓸 수 없으면 검증자 없이 일반 GET 으로 동작한다.
+    """
+
+    def __init__(self, host=None, port=None, key_prefix="feed_cache", ttl=CACHE_TTL):
+        self.host = host
+        self.port = port
+        self.client = get_client(host, port)
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+    def get_key(self, url: str) -> str:
+        return f"{self.key_prefix}:{generate_hash_id(url)}"
+
+    def get_many(self, urls: list) -> dict:
+        """URL 목록의 검증자를 한 번의 pipeline 으로 조회 → {url: {...}}"""
+        if not is_healthy(self.host, self.port):
+            return {}
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for url in urls:
+                pipe.hgetall(self.get_key(url))
+            return {url: data for url, data in zip(urls, pipe.execute()) if data}
+        except Exception as e:
+            logger.warning(f"FeedCache.get_many() 실패: {e}")
+            return {}
+
+    def save_many(self, responses: list):
+        """정상 응답(200)의 검증자 + 본문 지문 저장"""
+        if not responses or not is_healthy(self.host, self.port):
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for res in responses:
+                mapping = {
+                    "etag": res.headers.get("etag", ""),
+                    "last_modified": res.headers.get("last-modified", ""),
+                    "body_hash": res.fingerprint,
+                }
+                key = self.get_key(res.url)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"FeedCache.save_many() 실패: {e}")
+
+
+def conditional_headers(validators: dict) -> dict:
+    """저장된 검증자 → 조건부 요청 헤더"""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def body_fingerprint(body: bytes) -> str:
+    """응답 본문 지문 (요청마다 바뀌는 메타데이터 제외)"""
+    return hashlib.blake2b(VOLATILE_TAGS.sub(b"", body), digest_size=16).hexdigest()
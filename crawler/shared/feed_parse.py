@@ -0,0 +1,111 @@
+# shared/feed_parse.py
+"""
+피드 본문(bytes) → 기사 행(tuple).
+Redis/파일 I/O 없이 CPU 만 쓰는 함수라 파싱 워커 프로세스(shared/parse_pool.py)에서도 그대로 실행된다.
+
+    행 = (title, link, id, summary, content, published, author, categories, image_url)
+"""
+import time
+from itertools import islice
+import feedparser
+from lxml import etree
+from shared.logger_config import logger
+from shared.html_text import clean_html
+from shared.feed_stream import iter_entries
+from shared.hash_utils import generate_hash_id
+from shared.url_normalizer import canonical_url, url_key
+
+
+def field_spec(fields: dict) -> dict:
+    """sources.json 의 fields → 기본값을 채운 매핑 (워커로 넘기므로 단순 값만)"""
+    return {
+        "clean_title": fields.get("clean_title", False),
+        "summary": fields.get("summary", ["summary"]),
+        "summary_or_title": fields.get("summary_or_title", False),
+        "content": fields.get("content", ["content"]),
+        "author": fields.get("author", ""),
+        "published_fallback": fields.get("published_fallback", False),
+    }
+
+
+def _field(entry, name: str) -> str:
+    """entry 필드 값 (content 같은 목록/summary_detail 같은 dict 는 value 사용)"""
+    value = entry.get(name)
+    if isinstance(value, list):
+        value = value[0].get("value", "") if value else ""
+    elif isinstance(value, dict):
+        value = value.get("value", "")
+    return value or ""
+
+
+def iter_feed_entries(body: bytes, headers: dict, parser: str, name: str = ""):
+    """
+    entry 를 피드 순서대로.
+    parser="stream" 이면 lxml 로 하나씩 (중간에 멈추면 나머지는 파싱 안 함),
+    XML 오류가 나면 feedparser 로 대체 (이미 넘긴 항목은 건너뜀).
+    """
+    yielded = 0
+    if parser == "stream":
+        try:
+            for entry in iter_entries(body):
+                yield entry
+                yielded += 1
+            return
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"{name} 스트리밍 파싱 실패 ({yielded}개 이후) → feedparser 사용: {e}")
+
+    yield from islice(feedparser.parse(body, response_headers=headers).entries, yielded, None)
+
+
+def entry_row(entry, spec: dict):
+    """entry → 기사 행 (제목/링크가 없으면 None)"""
+    link = canonical_url(entry.get("link", ""))
+    title = entry.get("title", "").strip()
+    if spec["clean_title"]:
+        title = clean_html(title)
+    if not title or not link:
+        return None
+
+    summary_raw = next((v for v in (_field(entry, f) for f in spec["summary"]) if v), "")
+    summary = clean_html(summary_raw)
+    if not summary and spec["summary_or_title"]:
+        summary = title
+
+    content_html = ""
+    for f in spec["content"]:
+        content_html = summary_raw if f == "summary" else _field(entry, f)
+        if content_html:
+            break
+
+    if "tags" in entry:
+        categories = [tag.term for tag in entry.tags]
+    elif "category" in entry:
+        categories = [entry.category]
+    else:
+        categories = []
+
+    author = entry.get("author", "") or entry.get("dc_creator", "") or spec["author"]
+
+    published = entry.get("published", "")
+    if not published and spec["published_fallback"]:
+        published = entry.get("updated", "") or time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    media = entry.get("media_content")
+    image_url = media[0].get("url") if media else None
+
+    # 해시는 정규화한 원래 링크 기준 (Google News 원문 URL 해석 전)
+    article_hash = generate_hash_id(url_key(link), title)
+    return (title, link, article_hash, summary, clean_html(content_html), published, author, categories, image_url)
+
+
+def iter_rows(body: bytes, headers: dict, parser: str, spec: dict, name: str = ""):
+    """피드 본문 → 기사 행 (피드 순서대로, 필요한 만큼만)"""
+    for entry in iter_feed_entries(body, headers, parser, name):
+        row = entry_row(entry, spec)
+        if row:
+            yield row
+
+
+def parse_rows(body: bytes, headers: dict, parser: str, spec: dict, name: str = "") -> list:
+    """피드 본문 → 기사 행 목록 (워커 프로세스에서 실행)"""
+    return list(iter_rows(body, headers, parser, spec, name))
@@ -0,0 +1,102 @@
+# shared/feed_stream.py
+from io import BytesIO
+from lxml import etree
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+ITEM_TAGS = {"item", "entry"}                  # RSS 2.0 / RSS 1.0 item, Atom entry
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+
+class StreamEntry(dict):
+    """feedparser entry 처럼 entry.get("title") / entry.title 둘 다 되는 dict"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def _local(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _text(el) -> str:
+    return "".join(el.itertext()).strip()
+
+
+def _entry(item) -> StreamEntry:
+    """item/entry 요소 → collector 가 쓰는 필드만 추출"""
+    entry = StreamEntry()
+    tags = []
+    for child in item:
+        tag = child.tag
+        name = _local(tag)
+        ns = tag[1:].split("}", 1)[0] if isinstance(tag, str) and tag.startswith("{") else ""
+
+        if ns == MEDIA_NS:
+            if name == "content" and child.get("url"):
+                entry.setdefault("media_content", []).append(StreamEntry(url=child.get("url")))
+        elif name == "title" and "title" not in entry:
+            entry["title"] = _text(child)
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry.setdefault("link", _text(child))
+            elif child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href.strip())
+        elif name == "guid":
+            if child.get("isPermaLink", "true") != "false":
+                entry["_guid"] = _text(child)
+        elif name in ("description", "summary"):
+            entry.setdefault("summary", _text(child))
+        elif (name == "encoded" and ns == CONTENT_NS) or name == "content":
+            entry.setdefault("content", [StreamEntry(value=_text(child))])
+        elif name in ("pubDate", "published", "issued"):
+            entry.setdefault("published", _text(child))
+        elif name in ("updated", "modified", "date"):
+            # dc:date 는 feedparser 와 같이 updated 로
+            entry.setdefault("updated", _text(child))
+        elif name in ("author", "creator"):
+            # author 와 dc:creator 가 같이 있으면 feedparser 와 같이 나중 것
+            author = child.findtext("{*}name") if len(child) else None
+            entry["author"] = (author or _text(child)).strip()
+        elif name == "category":
+            term = child.get("term") or _text(child)
+            if term:
+                tags.append(StreamEntry(term=term))
+
+    # link 가 없으면 permalink guid 사용 (feedparser 와 동일)
+    guid = entry.pop("_guid", "")
+    if not entry.get("link") and guid.startswith("http"):
+        entry["link"] = guid
+    if "summary" in entry:
+        entry["summary_detail"] = StreamEntry(value=entry["summary"])
+    if tags:
+        entry["tags"] = tags
+    return entry
+
+
+def iter_entries(body: bytes):
+    """
+    RSS/Atom 본문에서 item 을 앞에서부터 하나씩 꺼냄 (lxml iterparse).
+    처리한 요소는 바로 비워서 큰 피드도 메모리를 적게 쓰고,
+    호출 쪽에서 중간에 멈추면 나머지는 파싱하지 않는다.
+    XML 이 깨졌으면 (raw &, 정의되지 않은 HTML 엔티티 등) 복구하지 않고 etree.XMLSyntaxError
+    → 호출 쪽에서 feedparser 로 대체 (복구 모드는 텍스트/링크를 바꿔서 해시가 달라짐).
+    """
+    context = etree.iterparse(
+        BytesIO(body), events=("end",), recover=False, resolve_entities=False, no_network=True, huge_tree=True,
+    )
+    for _, el in context:
+        if _local(el.tag) not in ITEM_TAGS:
+            continue
+        yield _entry(el)
+        # 이미 처리한 item 정리 (부모에 남아 있는 이전 형제까지)
+        el.clear()
+        parent = el.getparent()
+        while parent is not None and el.getprevious() is not None:
+            del parent[0]
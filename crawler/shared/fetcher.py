@@ -0,0 +1,204 @@
+# shared/fetcher.py
+import os
+import atexit
+import asyncio
+import threading
+import aiohttp
+from shared.logger_config import logger
+from shared.rate_limiter import limiter
+from shared.feed_cache import FeedCache, conditional_headers, body_fingerprint
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+USER_AGENT = "Mozilla/5.0 (BottlenFeedCollector/1.0)"
+
+CONNECT_LIMIT = int(os.getenv("FETCH_CONNECT_LIMIT", "64"))    # 전체 동시 연결 수
+LIMIT_PER_HOST = int(os.getenv("FETCH_LIMIT_PER_HOST", "4"))   # 호스트당 동시 연결 수
+TIMEOUT = int(os.getenv("FETCH_TIMEOUT", "15"))                # 요청당 최대 대기(초)
+KEEPALIVE = int(os.getenv("FETCH_KEEPALIVE", "60"))            # keep-alive 유지(초)
+THROTTLE_PAUSE = 60                                            # Retry-After 없는 429/503 대기(초)
+
+
+class FeedResponse:
+    """
+    피드 요청 결과.
+    body 는 파싱 전 원본 bytes, headers 는 소문자 key dict.
+    """
+
+    def __init__(self, url: str, status: int = 0, body: bytes = b"", headers: dict = None, error: str = None):
+        self.url = url
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.error = error
+        self.fingerprint = ""
+        self.body_unchanged = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and bool(self.body)
+
+    @property
+    def not_modified(self) -> bool:
+        """
+        지난 사이클 이후 변경 없음 → 파싱/해시/Bloom 체크 생략 대상
+        (304 응답 또는 검증자가 없는 피드의 본문 지문 일치)
+        """
+        return self.status == 304 or self.body_unchanged
+
+    def __repr__(self):
+        return f"FeedResponse({self.url!r}, status={self.status}, size={len(self.body)})"
+
+
+def _retry_after(headers: dict) -> float:
+    """Retry-After 헤더(초) 해석, 없으면 기본 대기 시간"""
+    try:
+        return float(headers.get("retry-after", THROTTLE_PAUSE))
+    except ValueError:
+        return THROTTLE_PAUSE
+
+
+class FeedFetcher:
+    """
+    aiohttp 기반 비동기 피드 다운로더.
+    백그라운드 스레드의 이벤트 루프 하나와 세션 하나를 프로세스 전체가 공유하므로
+    여러 Collector 스레드에서 호출해도 keep-alive 연결이 재사용된다.
+    """
+
+    def __init__(self, limit=CONNECT_LIMIT, limit_per_host=LIMIT_PER_HOST, timeout=TIMEOUT, cache: FeedCache = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.cache = cache
+        self._loop = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    # ───────── 이벤트 루프 / 세션
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._loop.run_forever, name="feed-fetcher", daemon=True)
+                thread.start()
+        return self._loop
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # 이벤트 루프 스레드 안에서만 호출됨
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=KEEPALIVE,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    # ───────── 요청
+    async def _fetch(self, url: str, validators: dict = None) -> FeedResponse:
+        session = self._get_session()
+        try:
+            # 호스트별 QPS 제한 (news.google.com 등 공용 호스트 보호)
+            await limiter.acquire(url)
+            # 이전 응답의 ETag / Last-Modified 로 조건부 요청 → 변경 없으면 304
+            async with session.get(url, headers=conditional_headers(validators or {})) as resp:
+                body = await resp.read()
+                headers = {k.lower(): v for k, v in resp.headers.items()}
+                if resp.status in (429, 503):
+                    limiter.pause(url, _retry_after(headers))
+                return FeedResponse(url, resp.status, body, headers)
+        except Exception as e:
+            logger.warning(f"피드 요청 실패: {url} ({e!r})")
+            return FeedResponse(url, error=repr(e))
+
+    async def _fetch_all(self, urls: list, validators: dict) -> list:
+        return await asyncio.gather(*(self._fetch(url, validators.get(url)) for url in urls))
+
+    def fetch_many(self, urls) -> dict:
+        """
+        URL 목록을 동시에 다운로드 (동기 호출용)
+        :return: {url: FeedResponse}
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+
+        validators = self.cache.get_many(urls) if self.cache else {}
+        future = asyncio.run_coroutine_threadsafe(self._fetch_all(urls, validators), self._ensure_loop())
+        results = future.result()
+
+        if self.cache:
+            for res in results:
+                if res.ok:
+                    # 검증자를 주지 않는 피드(Google News 등)는 본문 지문으로 비교
+                    res.fingerprint = body_fingerprint(res.body)
+                    res.body_unchanged = res.fingerprint == validators.get(res.url, {}).get("body_hash")
+
+            unchanged = sum(res.not_modified for res in results)
+            if unchanged:
+                logger.info(f"피드 {len(results)}개 중 {unchanged}개 변경 없음 (304 / 동일 본문)")
+
+        return {res.url: res for res in results}
+
+    def commit(self, responses):
+        """
+        처리(파싱 + 중복 체크)가 끝난 응답의 검증자 저장.
+        다운로드 직후가 아니라 처리 후에 저장해야, 처리 중 실패한 피드를
+        다음 사이클에 304/동일 본문으로 건너뛰지 않고 다시 받는다.
+        """
+        if self.cache:
+            self.cache.save_many([res for res in responses if res is not None and res.ok])
+
+    def run(self, coro_factory, timeout=None):
+        """
+        공용 이벤트 루프/세션에서 코루틴 실행 (동기 호출용)
+        :param coro_factory: session 을 받아 코루틴을 돌려주는 함수
+        """
+        async def runner():
+            return await coro_factory(self._get_session())
+        return asyncio.run_coroutine_threadsafe(runner(), self._ensure_loop()).result(timeout)
+
+    def close(self):
+        """세션 및 이벤트 루프 종료"""
+        if self._loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+        self._session = None
+
+
+# ───────────────────────────────
+# 프로세스 공용 fetcher
+# ───────────────────────────────
+_fetcher = FeedFetcher(cache=FeedCache())
+atexit.register(_fetcher.close)
+
+
+def fetch_feeds(urls) -> dict:
+    """여러 피드를 동시에 다운로드 → {url: FeedResponse}"""
+    return _fetcher.fetch_many(urls)
+
+
+def commit_feeds(responses):
+    """처리가 끝난 피드 응답의 ETag / Last-Modified / 본문 지문 저장"""
+    _fetcher.commit(responses)
+
+
+def run_async(coro_factory, timeout=None):
+    """공용 세션으로 임의의 비동기 작업 실행 (링크 해석 등)"""
+    return _fetcher.run(coro_factory, timeout)
+
+
+def fetch_feed(url: str) -> FeedResponse:
+    """피드 하나 다운로드"""
+    if not url:
+        return FeedResponse(url, error="empty url")
+    return fetch_feeds([url])[url]
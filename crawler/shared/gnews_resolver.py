@@ -0,0 +1,320 @@
+# shared/gnews_resolver.py
+import os
+import re
+import json
+import time
+import base64
+import asyncio
+import threading
+from shared.logger_config import logger
+from shared.redis_pool import get_client, is_healthy
+from shared.rate_limiter import TokenBucket
+from shared.fetcher import run_async
+from shared.url_normalizer import canonical_url
+from shared.article_registry import registry, canonical_id
+from shared.sinks import save_articles
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+RESOLVE_CONCURRENCY = int(os.getenv("GNEWS_RESOLVE_CONCURRENCY", "4"))  # 동시 해석 수
+RESOLVE_BUDGET = float(os.getenv("GNEWS_RESOLVE_BUDGET", "10"))         # 백필 1회당 최대 해석 시간(초)
+# 온라인 해석 전용 요청 속도 (피드 수집의 news.google.com limiter 와 따로 둬서 서로 밀리지 않게)
+RESOLVE_QPS = float(os.getenv("GNEWS_RESOLVE_QPS", "1"))
+RESOLVE_BURST = int(os.getenv("GNEWS_RESOLVE_BURST", "4"))
+BACKFILL_INTERVAL = float(os.getenv("GNEWS_BACKFILL_INTERVAL", "60"))   # 처리할 것이 없을 때 백필 주기(초)
+BACKFILL_BATCH = int(os.getenv("GNEWS_BACKFILL_BATCH", "20"))           # 백필 1회당 처리할 보류 기사 수
+CACHE_TTL = 90 * 24 * 3600       # 해석 결과 보관 기간
+FAILURE_TTL = 24 * 3600          # 해석 불가 링크는 하루 동안 재시도 안 함
+PENDING_TTL = 3 * 24 * 3600      # 이 기간 안에 해석하지 못한 보류 기사는 원래 링크로 확정
+THROTTLE_PAUSE = 300             # 429 응답 시 해석 중단 시간(초)
+
+ARTICLE_ID = re.compile(r"^https?://news\.google\.com/(?:rss/)?(?:articles|read)/([A-Za-z0-9_-]+)")
+SIGNATURE = re.compile(r'data-n-a-sg="([^"]+)"')
+TIMESTAMP = re.compile(r'data-n-a-ts="([^"]+)"')
+BATCH_URL = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
+
+
+def decode_offline(article_id: str):
+    """
+    예전 형식 ID 는 base64 protobuf 안에 원문 URL 이 그대로 들어 있어 요청 없이 복원된다.
+    새 형식(AU_yqL…)이면 None → 온라인 해석 필요.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except Exception:
+        return None
+    if raw.startswith(b"\x08\x13\x22"):
+        raw = raw[3:]
+    if raw.endswith(b"\xd2\x01\x00"):
+        raw = raw[:-3]
+    if len(raw) < 2:
+        return None
+
+    # protobuf varint 길이 (1~2바이트)
+    if raw[0] & 0x80:
+        length, start = (raw[0] & 0x7F) | (raw[1] << 7), 2
+    else:
+        length, start = raw[0], 1
+    url = raw[start:start + length].decode("utf-8", errors="ignore")
+    return url if url.startswith(("http://", "https://")) else None
+
+
+class GoogleNewsResolver:
+    """
+    Google News 리다이렉트 링크(news.google.com/rss/articles/…) → 원문 URL.
+    결과는 Redis(gnews_url:<article id>)에 저장해 링크마다 한 번만 해석한다.
+    수집 중에는 캐시/오프라인 복원만 하고, 나머지는 원래 링크로 저장한 뒤 보류 목록(gnews_pending)에 넣는다.
+    보류 기사는 백그라운드 스레드가 전용 토큰 버킷·시간 예산 안에서 온라인 해석하고,
+    해석되면 링크/canonical_id 를 고친 기사를 다시 저장(같은 id 로 upsert)한다.
+    """
+
+    def __init__(self, host=None, port=None, key_prefix="gnews_url", pending_key="gnews_pending"):
+        self.host = host
+        self.port = port
+        self.client = get_client(host, port)
+        self.key_prefix = key_prefix
+        self.pending_key = pending_key
+        self.bucket = TokenBucket(RESOLVE_QPS, RESOLVE_BURST)
+        self._cursor = 0
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def get_key(self, article_id: str) -> str:
+        return f"{self.key_prefix}:{article_id}"
+
+    # ───────── 캐시
+    def _load(self, ids: list) -> dict:
+        if not is_healthy(self.host, self.port):
+            return {}
+        try:
+            values = self.client.mget([self.get_key(i) for i in ids])
+            return {i: v for i, v in zip(ids, values) if v is not None}
+        except Exception as e:
+            logger.warning(f"Google News 링크 캐시 조회 실패: {e}")
+            return {}
+
+    def _save(self, resolved: dict):
+        if not resolved or not is_healthy(self.host, self.port):
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for article_id, url in resolved.items():
+                # 빈 문자열 = 해석 불가 (짧게 보관)
+                pipe.set(self.get_key(article_id), url, ex=CACHE_TTL if url else FAILURE_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Google News 링크 캐시 저장 실패: {e}")
+
+    # ───────── 온라인 해석
+    def _throttled(self):
+        logger.warning(f"news.google.com 링크 해석 요청 제한 감지 → {THROTTLE_PAUSE}초 대기")
+        self.bucket.pause(THROTTLE_PAUSE)
+
+    async def _decode_online(self, session, article_id: str, deadline: float):
+        """
+        기사 페이지의 서명/타임스탬프로 batchexecute 호출 → 원문 URL (실패 시 None, 해석 불가 시 "")
+        deadline 전에 요청 차례가 오지 않으면 요청하지 않고 None.
+        """
+        page_url = f"https://news.google.com/rss/articles/{article_id}"
+        if not await self.bucket.acquire(deadline):
+            return None
+        async with session.get(page_url) as resp:
+            if resp.status == 429:
+                self._throttled()
+                return None
+            html = await resp.text()
+        sg, ts = SIGNATURE.search(html), TIMESTAMP.search(html)
+        if not sg or not ts:
+            return ""
+
+        req = (
+            '["garturlreq",[["X","X",["X","X"],null,null,1,1,"US:en",null,1,null,null,null,null,null,0,1],'
+            f'"X","X",1,[1,1,1],1,1,null,0,0,null,0],"{article_id}",{ts.group(1)},"{sg.group(1)}"]'
+        )
+        if not await self.bucket.acquire(deadline):
+            return None
+        async with session.post(
+            BATCH_URL,
+            data={"f.req": json.dumps([[["Fbv4je", req, None, "generic"]]])},
+            headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
+        ) as resp:
+            if resp.status == 429:
+                self._throttled()
+                return None
+            text = await resp.text()
+        try:
+            payload = json.loads(text.split("\n\n")[1])[:-2]
+            return json.loads(payload[0][2])[1]
+        except Exception:
+            return ""
+
+    async def _resolve_all(self, session, ids: list) -> dict:
+        sem = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+        deadline = time.monotonic() + RESOLVE_BUDGET
+
+        async def one(article_id):
+            async with sem:
+                try:
+                    return article_id, await self._decode_online(session, article_id, deadline)
+                except Exception as e:
+                    logger.debug(f"Google News 링크 해석 실패: {article_id} ({e!r})")
+                    return article_id, None
+
+        tasks = [asyncio.ensure_future(one(i)) for i in ids]
+        done, pending = await asyncio.wait(tasks, timeout=RESOLVE_BUDGET)
+        for task in pending:
+            task.cancel()
+        return dict(task.result() for task in done)
+
+    def _lookup(self, ids: list) -> dict:
+        """캐시 + 오프라인 복원 → {article id: 원문 URL 또는 ""(해석 불가)}, 새로 복원한 것은 캐시에 저장"""
+        found = self._load(ids)
+        fresh = {}
+        for article_id in ids:
+            if article_id not in found:
+                url = decode_offline(article_id)
+                if url:
+                    fresh[article_id] = url
+        self._save(fresh)
+        found.update(fresh)
+        return found
+
+    # ───────── 공개 API
+    def resolve_many(self, links: list) -> dict:
+        """
+        Google News 링크 목록 → {링크: 원문 URL} (캐시/오프라인으로 바로 해석된 것만, 네트워크 요청 없음)
+        나머지는 defer 로 보류 목록에 넣어 백필에서 해석한다.
+        """
+        ids = {}
+        for link in links:
+            m = ARTICLE_ID.match(link)
+            if m:
+                ids.setdefault(m.group(1), link)
+        if not ids:
+            return {}
+
+        found = self._lookup(list(ids))
+        return {ids[i]: canonical_url(url) for i, url in found.items() if url}
+
+    def defer(self, scope: str, stream_dir: str, articles: list):
+        """원래 Google News 링크로 저장한 기사 → 보류 목록 (Redis 해시, 재시작해도 유지)"""
+        pending = {
+            article["id"]: json.dumps(
+                {"scope": scope, "stream_dir": stream_dir, "queued_at": time.time(), "article": article},
+                ensure_ascii=False,
+            )
+            for article in articles if ARTICLE_ID.match(article["link"])
+        }
+        if not pending:
+            return
+        if not is_healthy(self.host, self.port):
+            logger.warning(f"Redis 연결 불가 → Google News 링크 {len(pending)}개 해석 보류 기록 못 함")
+            return
+        try:
+            self.client.hset(self.pending_key, mapping=pending)
+        except Exception as e:
+            logger.warning(f"Google News 보류 목록 저장 실패: {e}")
+            return
+        self._ensure_started()
+
+    # ───────── 백필
+    def backfill(self) -> int:
+        """보류 기사 BACKFILL_BATCH 개를 해석해 다시 저장 → 처리(해석/포기)한 수"""
+        if not is_healthy(self.host, self.port):
+            return 0
+        try:
+            # 커서를 이어 가며 훑어서 계속 실패하는 항목이 뒤쪽 항목을 막지 않게 함
+            self._cursor, items = self.client.hscan(self.pending_key, cursor=self._cursor, count=BACKFILL_BATCH)
+        except Exception as e:
+            logger.warning(f"Google News 보류 목록 조회 실패: {e}")
+            return 0
+        entries = {}
+        for field, raw in list(items.items())[:BACKFILL_BATCH]:
+            try:
+                entries[field] = json.loads(raw)
+            except ValueError:
+                entries[field] = None
+        if not entries:
+            return 0
+
+        ids, done = {}, []
+        for field, entry in entries.items():
+            m = ARTICLE_ID.match(entry["article"]["link"]) if entry else None
+            if m:
+                ids.setdefault(m.group(1), []).append(field)
+            else:
+                done.append(field)  # 깨진 항목
+
+        found = self._lookup(list(ids))
+        remaining = [i for i in ids if i not in found]
+        if remaining:
+            results = run_async(lambda session: self._resolve_all(session, remaining))
+            fresh = {i: url for i, url in results.items() if url is not None}
+            self._save(fresh)
+            found.update(fresh)
+
+        now = time.time()
+        for article_id, fields in ids.items():
+            url = found.get(article_id)
+            for field in fields:
+                entry = entries[field]
+                if url:
+                    self._update(entry, canonical_url(url))
+                    done.append(field)
+                elif url == "" or now - entry["queued_at"] > PENDING_TTL:
+                    done.append(field)  # 해석 불가/기한 초과 → 원래 링크로 확정
+
+        if done:
+            try:
+                self.client.hdel(self.pending_key, *done)
+            except Exception as e:
+                logger.warning(f"Google News 보류 목록 정리 실패: {e}")
+        return len(done)
+
+    def _update(self, entry: dict, url: str):
+        """해석된 원문 URL 로 기사 기록 갱신 (같은 id 로 다시 저장 → sink 에서 upsert)"""
+        article = {**entry["article"], "link": url, "canonical_id": canonical_id(url)}
+        # 원문 URL 기준으로 전역 등록 (다른 소스가 이미 수집한 기사면 소속만 추가됨)
+        if not registry.claim_many(entry["scope"], [url], [True])[0]:
+            logger.info(f"Google News 링크 해석 결과 다른 곳에서 이미 수집한 기사: {url}")
+        save_articles([article], entry["stream_dir"])
+
+    def _run(self):
+        # 처리한 것이 있으면 바로 다음 묶음, 없으면(요청 제한/전부 보류) 주기만큼 쉼
+        delay = BACKFILL_INTERVAL
+        while not self._stop.wait(delay):
+            try:
+                delay = 0 if self.backfill() else BACKFILL_INTERVAL
+            except Exception as e:
+                logger.error(f"Google News 링크 백필 실패: {e}")
+                delay = BACKFILL_INTERVAL
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="gnews-backfill", daemon=True)
+                self._thread.start()
+
+
+# ───────────────────────────────
+# 프로세스 공용 인스턴스
+# ───────────────────────────────
+resolver = GoogleNewsResolver()
+
+
+def resolve_links(links: list, only: list = None) -> list:
+    """
+    링크 목록 중 Google News 링크를 원문 URL 로 바꿔서 반환 (순서 유지, 바로 해석된 것만)
+    :param only: 같은 길이의 bool 목록, True 인 링크만 해석 (예: 새 기사)
+    """
+    resolver._ensure_started()  # 이전 실행에서 남은 보류 기사도 이어서 처리
+    targets = [link for i, link in enumerate(links) if only is None or only[i]]
+    resolved = resolver.resolve_many(targets)
+    return [resolved.get(link, link) for link in links]
+
+
+def defer_unresolved(scope: str, stream_dir: str, articles: list):
+    """아직 Google News 링크인 기사 → 백그라운드 해석 대상"""
+    resolver.defer(scope, stream_dir, articles)
@@ -0,0 +1,64 @@
+# shared/html_text.py
+import re
+from html import unescape
+
+# ───────────────────────────────
+# 정규식 (모듈 로드 시 한 번만 컴파일)
+# ───────────────────────────────
+_ATTRS = r"""(?:[^>"']|"[^"]*"|'[^']*')*"""
+
+# html.parser 처럼 왼쪽부터 한 번에 훑으며 마크업 구간을 찾음
+#  - 주석, <!DOCTYPE>/<?xml?>, script/style/template 내용은 get_text() 에 포함되지 않음
+#  - '<' 다음이 영문자/'/' 일 때만 태그 ("a < b" 는 텍스트)
+#  - 닫는 태그는 따옴표와 상관없이 첫 '>' 에서 끝남
+#  - "</ p>" 는 닫는 태그, '</' 다음이 영문자/공백이 아니면 ("</3>") 다음 '>' 까지 bogus comment → 둘 다 경계(공백)
+#  - "</>" 는 아무것도 만들지 않음 → 앞뒤 텍스트가 그대로 붙음
+_MARKUP = re.compile(
+    r"<!--.*?-->"
+    rf"|<(script|style|template)\b{_ATTRS}>.*?(?:</\1\s*>|$)"
+    rf"|<[A-Za-z]{_ATTRS}>"
+    r"|</[^>]*>|<![^>]*>|<\?[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# html.parser 가 엔티티 해석 없이 그대로 내보내는 구간 (CDATA, 끝까지 닫히지 않은 주석/태그)
+# → 드문 경우라 원래 방식으로 처리
+_LITERAL = re.compile(r"<!\[CDATA\[|<!--(?:(?!-->).)*$|</?[A-Za-z][^>]*$|</[^>]*$", re.DOTALL)
+
+
+def _boundary(m) -> str:
+    return "" if m.group(0) == "</>" else " "
+
+
+def _soup_text(raw_html: str) -> str:
+    from bs4 import BeautifulSoup
+    return " ".join(BeautifulSoup(raw_html, "html.parser").get_text(separator=" ", strip=True).split())
+
+
+def clean_html(raw_html: str) -> str:
+    """
+    HTML → 공백 정리된 텍스트.
+    " ".join(BeautifulSoup(raw_html, "html.parser").get_text(separator=" ", strip=True).split()) 와 같은 결과를
+    트리를 만들지 않고 계산한다 (태그 경계 = 공백, 엔티티 해석, 연속 공백은 하나로).
+
+    엔티티는 html.unescape(HTML5 규칙)로 해석하므로 세미콜론 없는/모르는 엔티티는 BeautifulSoup 과 다르다.
+      "&amp" → "&" (BS: "&amp"), "&#39" → "'" (BS: "&#39"), "&unknown;" → "&unknown;" (BS: "&unknown")
+    <template> 은 첫 </template> 까지 통째로 제외한다 (안에서 바깥 요소의 닫는 태그로 template 이 먼저 닫히는 경우는 다름).
+    나머지는 tests/test_html_text.py 의 fuzz 로 BeautifulSoup 과 같은 결과인지 확인한다.
+    """
+    if not raw_html:
+        return ""
+    if "<" not in raw_html:
+        # 마크업 없음 (RSS 제목 대부분) → 엔티티만 해석
+        if "&" in raw_html:
+            raw_html = unescape(raw_html)
+        return " ".join(raw_html.split())
+
+    if _LITERAL.search(raw_html):
+        return _soup_text(raw_html)
+
+    # 태그 경계는 공백 (get_text(separator=" ") 와 동일)
+    text = _MARKUP.sub(_boundary if "</>" in raw_html else " ", raw_html)
+    if "&" in text:
+        text = unescape(text)
+    return " ".join(text.split())
@@ -0,0 +1,96 @@
+# shared/kafka_sink.py
+import os
+import json
+import threading
+from shared.logger_config import logger
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+KAFKA_BOOTSTRAP = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+KAFKA_TOPIC = os.getenv("KAFKA_ARTICLE_TOPIC", "crawler.articles")
+KAFKA_MEMBERSHIP_TOPIC = os.getenv("KAFKA_MEMBERSHIP_TOPIC", "crawler.article_topics")  # 기사 소속 추가 이벤트
+KAFKA_COMPRESSION = os.getenv("KAFKA_COMPRESSION", "gzip")   # lz4/snappy/zstd 는 별도 패키지 필요
+
+PRODUCER_CONFIG = {
+    "acks": 1,
+    "linger_ms": 50,                       # 최대 50ms 모아서 전송
+    "batch_size": 256 * 1024,              # 파티션별 배치 크기
+    "buffer_memory": 32 * 1024 * 1024,     # 전송 대기 메시지 메모리 상한
+    "max_block_ms": 10000,                 # 버퍼가 가득 차면 send() 가 최대 10초 대기 (backpressure)
+    "max_in_flight_requests_per_connection": 5,
+    "retries": 3,
+}
+
+
+def _serialize(value: dict) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class KafkaSink:
+    """
+    수집 기사 → Kafka 토픽.
+    key = canonical_id 라서 같은 기사는 (토픽/소스가 달라도) 항상 같은 파티션으로 간다.
+    기사 소속 추가는 membership_topic 으로 보낸다 (key = canonical_id).
+    producer 를 직접 넘기면 (send/flush/close 를 가진 객체) 브로커 없이 테스트할 수 있다.
+    """
+
+    def __init__(self, producer=None, topic: str = KAFKA_TOPIC, membership_topic: str = KAFKA_MEMBERSHIP_TOPIC):
+        self.topic = topic
+        self.membership_topic = membership_topic
+        self.producer = producer or self._create_producer()
+        self.sent = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_producer():
+        from kafka import KafkaProducer
+        return KafkaProducer(
+            bootstrap_servers=KAFKA_BOOTSTRAP.split(","),
+            compression_type=KAFKA_COMPRESSION or None,
+            key_serializer=lambda k: k.encode("utf-8"),
+            value_serializer=_serialize,
+            **PRODUCER_CONFIG,
+        )
+
+    def _on_success(self, _metadata):
+        with self._lock:
+            self.sent += 1
+
+    def _on_error(self, e):
+        with self._lock:
+            self.failed += 1
+        logger.error(f"Kafka 전송 실패 ({self.topic}): {e}")
+
+    def write(self, source: str, articles: list):
+        """비동기 전송 (배치/압축은 producer 가 처리, 버퍼가 가득 차면 여기서 대기)"""
+        headers = [("source", source.encode("utf-8"))]
+        for article in articles:
+            future = self.producer.send(
+                self.topic,
+                key=article.get("canonical_id") or article["id"],
+                value={**article, "source": source},
+                headers=headers,
+            )
+            future.add_callback(self._on_success)
+            future.add_errback(self._on_error)
+
+    def add_memberships(self, records: list):
+        for record in records:
+            future = self.producer.send(self.membership_topic, key=record["canonical_id"], value=record)
+            future.add_callback(self._on_success)
+            future.add_errback(self._on_error)
+
+    def flush(self, timeout: float = None):
+        self.producer.flush(timeout)
+
+    def close(self):
+        try:
+            self.producer.flush()
+            self.producer.close()
+        except Exception as e:
+            logger.warning(f"Kafka producer 종료 실패: {e}")
+
+    def stats(self) -> dict:
+        return {"sent": self.sent, "failed": self.failed}
@@ -0,0 +1,65 @@
+# shared/local_filter.py
+import os
+import threading
+from collections import OrderedDict
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+LOCAL_FILTER_SIZE = int(os.getenv("LOCAL_FILTER_SIZE", "100000"))  # 기억할 최근 해시 수 (약 20MB)
+
+
+class RecentHashCache:
+    """
+    최근에 RedisBloom 에 들어간 (key, hash) 를 기억하는 LRU.
+    여기 있는 값은 Redis 필터에도 반드시 존재하므로 "이미 본 기사"로
+    바로 판정할 수 있다 (Bloom 과 달리 오탐 없음).
+    크기는 maxsize 로 고정되어 메모리가 무한히 늘지 않는다.
+    """
+
+    def __init__(self, maxsize: int = LOCAL_FILTER_SIZE):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _item(key: str, value: str) -> str:
+        # sha256 hex 앞 32자(128bit)만 저장해도 충돌 가능성은 무시할 수준
+        return f"{key}|{value[:32]}"
+
+    def split(self, key: str, values: list) -> list:
+        """값마다 True → 최근에 본 값 (Redis 조회 불필요)"""
+        seen = []
+        with self._lock:
+            for value in values:
+                item = self._item(key, value)
+                if item in self._items:
+                    self._items.move_to_end(item)
+                    seen.append(True)
+                else:
+                    seen.append(False)
+            hit = sum(seen)
+            self.hits += hit
+            self.misses += len(values) - hit
+        return seen
+
+    def remember(self, key: str, values: list):
+        """Redis 필터에 들어간 값 기록 (오래된 값부터 밀려남)"""
+        with self._lock:
+            for value in values:
+                item = self._item(key, value)
+                self._items[item] = None
+                self._items.move_to_end(item)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
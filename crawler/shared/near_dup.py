@@ -0,0 +1,172 @@
+# shared/near_dup.py
+import re
+import time
+import hashlib
+import logging
+from shared.redis_pool import get_client, is_healthy
+from shared.bloom_filter import GENERATION_SECONDS, GENERATIONS
+
+logger = logging.getLogger(__name__)
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+BANDS = 6                 # 64bit 서명을 밴드 6개(11/11/11/11/10/10bit)로 분할
+MAX_DISTANCE = 5          # 해밍 거리 5 이하 → 같은 스토리 (밴드 하나는 반드시 일치)
+MIN_TOKENS = 8            # 단어가 너무 적은 글은 오탐이 많아 제외
+BUCKET_TTL = GENERATION_SECONDS * GENERATIONS  # 버킷은 Bloom 과 같은 기간별 세대로 나누고 같은 기간만 보관
+
+TOKEN = re.compile(r"[a-z0-9]+")
+# 밴드별 (시작 bit, mask)
+_widths = [64 // BANDS + (i < 64 % BANDS) for i in range(BANDS)]
+BAND_SLICES = [(sum(_widths[:i]), (1 << w) - 1) for i, w in enumerate(_widths)]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(text: str):
+    """
+    64bit SimHash (단어 기준, 제목+요약처럼 짧은 글은 n-gram 보다 단어 단위가 안정적)
+    단어 수가 MIN_TOKENS 미만이면 None
+    """
+    tokens = TOKEN.findall(text.lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    votes = [0] * 64
+    for h in map(_feature_hash, tokens):
+        for i in range(64):
+            votes[i] += 1 if h >> i & 1 else -1
+    return sum(1 << i for i, v in enumerate(votes) if v > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicateIndex:
+    """
+    SimHash + 밴드 LSH 기반 유사 기사 묶음(story) 인덱스.
+    밴드 값별 버킷(near_dup:g<세대>:<band>:<값>)을 Redis 해시로 두고 {서명: story_id} 를 저장한다.
+    쓰기는 최신 세대 버킷에만 하고 조회는 최근 GENERATIONS 개 세대를 보므로,
+    지난 세대 버킷은 TTL 로 통째로 만료되어 버킷 크기와 Redis 메모리가 한 기간 분량으로 유지된다.
+    같은 버킷 후보끼리만 해밍 거리를 비교하므로 기사당 비교 비용이 거의 일정하다.
+    묶인 유사 기사 id 는 near_dup:story:<story_id> 집합에 남긴다.
+    Redis 를 쓸 수 없으면 같은 배치 안에서만 묶는다.
+    """
+
+    def __init__(self, host=None, port=None, key_prefix="near_dup", max_distance=MAX_DISTANCE):
+        self.host = host
+        self.port = port
+        self.client = get_client(host, port)
+        self.key_prefix = key_prefix
+        self.max_distance = max_distance
+
+    @staticmethod
+    def generations() -> list:
+        """조회할 세대 번호 (최신 세대부터)"""
+        current = int(time.time() // GENERATION_SECONDS)
+        return [current - i for i in range(GENERATIONS)]
+
+    def bucket_keys(self, sig: int, generation: int) -> list:
+        return [
+            f"{self.key_prefix}:g{generation}:{b}:{(sig >> shift) & mask:03x}"
+            for b, (shift, mask) in enumerate(BAND_SLICES)
+        ]
+
+    def _load(self, keys: list) -> dict:
+        if not keys or not is_healthy(self.host, self.port):
+            return {}
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            return dict(zip(keys, pipe.execute()))
+        except Exception as e:
+            logger.warning(f"NearDuplicateIndex 조회 실패: {e}")
+            return {}
+
+    def story_key(self, story_id: str) -> str:
+        return f"{self.key_prefix}:story:{story_id}"
+
+    def _save(self, entries: list, copies: list):
+        if not entries or not is_healthy(self.host, self.port):
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, sig_hex, story_id in entries:
+                pipe.hset(key, sig_hex, story_id)
+                pipe.expire(key, BUCKET_TTL)
+            for story_id, article_id in copies:
+                # 스토리에 묶인 유사 기사 id 기록
+                pipe.sadd(self.story_key(story_id), article_id)
+                pipe.expire(self.story_key(story_id), BUCKET_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"NearDuplicateIndex 저장 실패: {e}")
+
+    def assign_many(self, items: list) -> list:
+        """
+        (article_id, text) 목록 → 값마다 (story_id, 유사 기사 여부)
+        처음 나온 기사는 자기 id 가 story_id 가 된다.
+        """
+        sigs = [simhash(text) for _, text in items]
+        generations = self.generations()
+        keys = [
+            [k for gen in generations for k in self.bucket_keys(sig, gen)] if sig is not None else []
+            for sig in sigs
+        ]
+        buckets = self._load(list(dict.fromkeys(k for ks in keys for k in ks)))
+
+        result, entries, copies = [], [], []
+        for (article_id, _), sig, sig_keys in zip(items, sigs, keys):
+            if sig is None:
+                result.append((article_id, False))
+                continue
+
+            story_id = None
+            for key in sig_keys:
+                for other_hex, other_story in buckets.get(key, {}).items():
+                    if hamming(sig, int(other_hex, 16)) <= self.max_distance:
+                        story_id = other_story
+                        break
+                if story_id:
+                    break
+
+            is_copy = story_id is not None
+            story_id = story_id or article_id
+            sig_hex = f"{sig:016x}"
+            for key in self.bucket_keys(sig, generations[0]):
+                # 최신 세대에만 기록, 같은 배치 안의 뒤쪽 기사도 비교되도록 로컬 버킷에도 반영
+                buckets.setdefault(key, {})[sig_hex] = story_id
+                entries.append((key, sig_hex, story_id))
+            if is_copy:
+                copies.append((story_id, article_id))
+            result.append((story_id, is_copy))
+
+        self._save(entries, copies)
+        return result
+
+    def filter_articles(self, articles: list):
+        """
+        clean_html 을 거친 기사 목록에 story_id 를 붙이고 유사 기사는 제외
+        :return: (남은 기사, 제외된 수)
+        """
+        if not articles:
+            return articles, 0
+        stories = self.assign_many([
+            (a["id"], f"{a.get('title', '')} {a.get('summary', '')}") for a in articles
+        ])
+        kept = []
+        for article, (story_id, is_copy) in zip(articles, stories):
+            if is_copy:
+                continue
+            article["story_id"] = story_id
+            kept.append(article)
+        return kept, len(articles) - len(kept)
+
+
+# 프로세스 공용 인스턴스
+near_dups = NearDuplicateIndex()
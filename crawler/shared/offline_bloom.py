@@ -0,0 +1,151 @@
+# shared/offline_bloom.py
+import os
+import math
+import atexit
+import mmap
+import struct
+import hashlib
+import threading
+from shared.logger_config import logger
+from shared.utils import get_data_dir
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+OFFLINE_CAPACITY = int(os.getenv("OFFLINE_BLOOM_CAPACITY", "2000000"))
+OFFLINE_ERROR_RATE = 0.001
+
+MAGIC = b"BLMF"
+HEADER = struct.Struct("<4sIQ")  # magic, 해시 함수 수(k), 저장된 항목 수
+
+
+class OfflineBloomFilter:
+    """
+    Redis 장애 시 사용하는 로컬 Bloom 필터.
+    비트 배열은 mmap 으로 파일에 매핑되어 있어 프로세스가 재시작돼도 유지된다.
+
+    - 평소에는 Redis 에 넣은 값을 그림자로 같이 기록 (장애 시 과거 이력 확보)
+    - 장애 중에 새로 판정한 값은 pending 파일에 쌓아두고,
+      Redis 가 복구되면 drain_pending() 으로 꺼내 RedisBloom 에 반영한다.
+    """
+
+    def __init__(self, path: str, capacity: int = OFFLINE_CAPACITY, error_rate: float = OFFLINE_ERROR_RATE):
+        self.path = path
+        self.pending_path = os.path.splitext(path)[0] + "_pending.tsv"
+        self.capacity = capacity
+        self.num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._lock = threading.Lock()
+        self._mm = self._open()
+
+    # ───────── 파일 매핑
+    def _open(self) -> mmap.mmap:
+        size = HEADER.size + (self.num_bits + 7) // 8
+        fresh = not os.path.exists(self.path) or os.path.getsize(self.path) != size
+
+        with open(self.path, "a+b") as f:
+            if fresh:
+                # 설정이 바뀌었거나 처음 만드는 경우 → 빈 필터로 초기화
+                f.truncate(0)
+                f.truncate(size)
+            mm = mmap.mmap(f.fileno(), size)
+
+        if fresh or mm[:4] != MAGIC:
+            HEADER.pack_into(mm, 0, MAGIC, self.num_hashes, 0)
+        return mm
+
+    @property
+    def count(self) -> int:
+        return HEADER.unpack_from(self._mm, 0)[2]
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    # ───────── 조회 / 추가
+    def add_many(self, key: str, values: list, pending: bool = False) -> list:
+        """
+        값마다 True → 새 데이터 / False → 이미 존재 (BloomFilter.add_many 와 동일)
+        :param pending: True 면 Redis 복구 후 반영할 목록에도 기록
+        """
+        result = []
+        with self._lock:
+            if self.count >= self.capacity:
+                # 포화되면 오탐률이 급격히 오르므로 비우고 다시 시작
+                logger.warning(f"오프라인 Bloom 포화 ({self.count}) → 초기화")
+                self._mm[HEADER.size:] = bytes(len(self._mm) - HEADER.size)
+                HEADER.pack_into(self._mm, 0, MAGIC, self.num_hashes, 0)
+
+            mm = self._mm
+            added = 0
+            for value in values:
+                is_new = False
+                for pos in self._positions(f"{key}|{value}"):
+                    idx, bit = HEADER.size + (pos >> 3), 1 << (pos & 7)
+                    if not mm[idx] & bit:
+                        mm[idx] |= bit
+                        is_new = True
+                added += is_new
+                result.append(is_new)
+            HEADER.pack_into(mm, 0, MAGIC, self.num_hashes, self.count + added)
+
+            if pending:
+                new_values = [v for v, is_new in zip(values, result) if is_new]
+                if new_values:
+                    with open(self.pending_path, "a", encoding="utf-8") as f:
+                        f.writelines(f"{key}\t{v}\n" for v in new_values)
+        return result
+
+    def contains(self, key: str, value: str) -> bool:
+        with self._lock:
+            return all(
+                self._mm[HEADER.size + (pos >> 3)] & (1 << (pos & 7))
+                for pos in self._positions(f"{key}|{value}")
+            )
+
+    # ───────── 복구 후 동기화
+    def has_pending(self) -> bool:
+        return os.path.exists(self.pending_path)
+
+    def drain_pending(self) -> dict:
+        """장애 중 쌓인 값 → {key: [hash, ...]} (파일은 비움)"""
+        grouped = {}
+        with self._lock:
+            if not os.path.exists(self.pending_path):
+                return grouped
+            with open(self.pending_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.rstrip("\n").partition("\t")
+                    if value:
+                        grouped.setdefault(key, []).append(value)
+            os.remove(self.pending_path)
+        return grouped
+
+    def restore_pending(self, grouped: dict):
+        """동기화 실패 시 다시 pending 으로 되돌림"""
+        with self._lock:
+            with open(self.pending_path, "a", encoding="utf-8") as f:
+                for key, values in grouped.items():
+                    f.writelines(f"{key}\t{v}\n" for v in values)
+
+    def flush(self):
+        """비트 배열을 디스크에 즉시 기록"""
+        with self._lock:
+            self._mm.flush()
+
+
+# ───────────────────────────────
+# 프로세스 공용 인스턴스 (첫 사용 시 생성)
+# ───────────────────────────────
+_offline = None
+_offline_lock = threading.Lock()
+
+
+def get_offline_filter() -> OfflineBloomFilter:
+    global _offline
+    with _offline_lock:
+        if _offline is None:
+            _offline = OfflineBloomFilter(os.path.join(get_data_dir("shared"), "offline_bloom.bin"))
+            atexit.register(_offline.flush)
+        return _offline
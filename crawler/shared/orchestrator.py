@@ -0,0 +1,120 @@
+import os
+import sys
+import glob
+import time
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from shared.logger_config import logger
+from shared.rss_engine import load_sources
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+CRAWLER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+COLLECTOR_PATTERN = os.path.join(CRAWLER_ROOT, "*", "src", "*_collector.py")
+
+MAX_WORKERS = int(os.getenv("CRAWLER_MAX_WORKERS", "8"))       # 동시에 실행할 소스 수
+CYCLE_TIMEOUT = int(os.getenv("CRAWLER_CYCLE_TIMEOUT", "1800"))  # 한 사이클 최대 대기(초)
+
+# 이전 사이클에서 아직 끝나지 않은 소스 (중복 실행 방지)
+_running = set()
+_running_lock = threading.Lock()
+
+
+# ───────────────────────────────
+# Collector 탐색
+# ───────────────────────────────
+def discover_collectors() -> dict:
+    """
+    {source: run_cycle} 형태로 반환.
+    shared/config/sources.json 의 RSS 소스는 공용 엔진으로 바로 실행하고,
+    그 외 <source>/src/*_collector.py 중 run_cycle 을 가진 모듈만 import 한다.
+    import 실패한 소스는 건너뛰고 나머지는 그대로 수집한다.
+    """
+    collectors = {source: rss.run_cycle for source, rss in load_sources().items()}
+
+    for path in sorted(glob.glob(COLLECTOR_PATTERN)):
+        src_dir = os.path.dirname(path)
+        source = os.path.basename(os.path.dirname(src_dir))
+        if source in collectors:
+            continue
+        module_name = os.path.splitext(os.path.basename(path))[0]
+
+        # mit_tech 처럼 src 내부 모듈을 직접 import 하는 소스 대응
+        if src_dir not in sys.path:
+            sys.path.append(src_dir)
+
+        try:
+            module = importlib.import_module(f"{source}.src.{module_name}")
+        except Exception as e:
+            logger.error(f"[{source}] collector import 실패 ({module_name}): {e}")
+            continue
+
+        run_cycle = getattr(module, "run_cycle", None)
+        if callable(run_cycle):
+            collectors[source] = run_cycle
+
+    return collectors
+
+
+# ───────────────────────────────
+# 소스 단위 실행 (격리)
+# ───────────────────────────────
+def _run_source(source: str, run_cycle) -> dict:
+    """소스 하나의 run_cycle 실행. 예외는 해당 소스 안에서만 처리"""
+    started = time.time()
+    try:
+        result = run_cycle() or {}
+        status = "ok"
+    except Exception as e:
+        logger.error(f"[{source}] run_cycle 오류: {e}")
+        result, status = {}, "error"
+    finally:
+        with _running_lock:
+            _running.discard(source)
+
+    return {
+        "source": source,
+        "status": status,
+        "elapsed": round(time.time() - started, 2),
+        "result": result,
+    }
+
+
+def run_all(collectors: dict, max_workers: int = MAX_WORKERS, timeout: int = CYCLE_TIMEOUT) -> list:
+    """
+    모든 소스를 워커 풀에서 동시에 실행.
+    timeout 안에 끝나지 않은 소스는 결과에 timeout 으로 기록하고
+    다음 사이클에서 끝날 때까지 다시 실행하지 않는다.
+    """
+    results = []
+    futures = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collector")
+    try:
+        for source, run_cycle in collectors.items():
+            with _running_lock:
+                if source in _running:
+                    logger.warning(f"[{source}] 이전 사이클 진행 중 → 이번 사이클 건너뜀")
+                    results.append({"source": source, "status": "skipped", "elapsed": 0, "result": {}})
+                    continue
+                _running.add(source)
+            futures[executor.submit(_run_source, source, run_cycle)] = source
+
+        done, not_done = wait(futures, timeout=timeout)
+        results.extend(f.result() for f in done)
+
+        for f in not_done:
+            source = futures[f]
+            if f.cancel():
+                # 시작도 못 한 소스는 실행 중 목록에서 바로 해제
+                with _running_lock:
+                    _running.discard(source)
+            logger.error(f"[{source}] {timeout}초 내 완료되지 않음")
+            results.append({"source": source, "status": "timeout", "elapsed": timeout, "result": {}})
+    finally:
+        # 멈춘 소스 때문에 전체 사이클이 막히지 않도록 기다리지 않음
+        executor.shutdown(wait=False)
+
+    return sorted(results, key=lambda r: r["source"])
@@ -0,0 +1,94 @@
+# shared/parse_pool.py
+import os
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from shared.logger_config import logger
+from shared.feed_parse import parse_rows
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+# feedparser/clean_html 은 순수 파이썬 CPU 작업이라 스레드로는 GIL 에 묶임 → 별도 프로세스에서 파싱
+# 기본은 0 (풀 없이 수집 스레드에서 필요한 만큼만 파싱), 2 이상이면 그 수만큼 워커 프로세스 사용
+PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "0"))
+# 워커 결과를 기다리는 최대 시간 (초), 넘으면 수집 스레드에서 직접 파싱
+PARSE_TIMEOUT = float(os.getenv("FEED_PARSE_TIMEOUT", "30"))
+
+
+class ParsePool:
+    """
+    피드 파싱 전용 프로세스 풀.
+    원본 bytes 를 넘기고 기사 행(tuple) 목록을 돌려받는다 (다운로드/저장/중복 체크는 메인 프로세스).
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS, timeout: float = PARSE_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: fetcher/writer 스레드가 잡고 있던 락을 fork 로 물려받지 않도록
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        """워커가 비정상 종료돼 깨진 풀은 버리고 다음 요청 때 새로 생성"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("파싱 워커 풀이 깨져 다시 시작합니다")
+
+    def submit(self, body: bytes, headers: dict, parser: str, spec: dict, name: str = ""):
+        """파싱 작업 제출 → Future (결과: 기사 행 목록), 풀을 안 쓰면 None"""
+        if not self.enabled:
+            return None
+        executor = self._get_executor()
+        try:
+            return executor.submit(parse_rows, body, headers, parser, spec, name)
+        except BrokenProcessPool:
+            self._reset(executor)
+            return self._get_executor().submit(parse_rows, body, headers, parser, spec, name)
+
+    def result(self, future) -> list:
+        """
+        파싱 결과.
+        풀이 깨졌거나 timeout 안에 끝나지 않으면 None (호출 쪽에서 직접 파싱), 파싱 자체의 예외는 그대로 전달.
+        """
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            logger.warning(f"파싱 워커 응답 없음 ({self.timeout}s) → 직접 파싱")
+            return None
+        except BrokenProcessPool:
+            with self._lock:
+                executor = self._executor
+            if executor is not None:
+                self._reset(executor)
+            return None
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# ───────────────────────────────
+# 프로세스 공용 풀 (첫 파싱 요청 시 워커 생성)
+# ───────────────────────────────
+parse_pool = ParsePool()
+atexit.register(parse_pool.close)
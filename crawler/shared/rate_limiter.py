@@ -0,0 +1,129 @@
+# shared/rate_limiter.py
+import os
+import json
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+from shared.logger_config import logger
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+CONFIG_PATH = os.getenv(
+    "RATE_LIMIT_CONFIG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "rate_limits.json"),
+)
+DEFAULT_QPS = 5
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """
+    토큰 버킷. 스레드/이벤트 루프 어디서 호출해도 안전하도록
+    '예약' 방식으로 동작한다 (토큰을 먼저 차감하고 기다릴 시간을 돌려줌).
+    """
+
+    def __init__(self, qps: float, burst: int):
+        self.rate = float(qps)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 → 요청 전에 기다려야 할 시간(초)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self):
+        """예약했지만 쓰지 않은 토큰 반환 (대기 중 취소 등)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    async def acquire(self, deadline: float = None) -> bool:
+        """
+        토큰 1개 (비동기 대기)
+        :param deadline: time.monotonic() 기준 마감, 그 전에 차례가 오지 않으면 예약하지 않고 False
+        취소되면 예약한 토큰을 돌려줘서 다음 요청이 그만큼 밀리지 않게 한다.
+        """
+        delay = self.reserve()
+        if delay <= 0:
+            return True
+        if deadline is not None and time.monotonic() + delay > deadline:
+            self.refund()
+            return False
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.refund()
+            raise
+        return True
+
+    def pause(self, seconds: float):
+        """서버가 제한을 알려온 경우 seconds 동안 새 요청을 막음"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 모음.
+    rate_limits.json 의 hosts 에 없는 호스트는 default 설정을 사용한다.
+    """
+
+    def __init__(self, limits: dict = None, default: dict = None):
+        self.limits = limits or {}
+        self.default = default or {"qps": DEFAULT_QPS, "burst": DEFAULT_BURST}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, path: str = CONFIG_PATH):
+        """설정 파일 로드 (없거나 깨져 있으면 기본값)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
+            return cls(cfg.get("hosts", {}), cfg.get("default"))
+        except Exception as e:
+            logger.warning(f"rate limit 설정 로드 실패 → 기본값 사용 ({e})")
+            return cls()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                cfg = self.limits.get(host, self.default)
+                bucket = TokenBucket(cfg.get("qps", DEFAULT_QPS), cfg.get("burst", DEFAULT_BURST))
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait(self, url: str):
+        """동기 요청(requests 등) 전에 호출"""
+        delay = self._bucket(url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self, url: str, deadline: float = None) -> bool:
+        """비동기 요청(aiohttp) 전에 호출 (deadline 은 TokenBucket.acquire 참고)"""
+        return await self._bucket(url).acquire(deadline)
+
+    def pause(self, url: str, seconds: float):
+        """429 / Retry-After 응답 시 해당 호스트 일시 정지"""
+        logger.warning(f"{urlparse(url).netloc} 요청 제한 감지 → {seconds:.0f}초 대기")
+        self._bucket(url).pause(seconds)
+
+
+# ───────────────────────────────
+# 프로세스 공용 limiter
+# ───────────────────────────────
+limiter = HostRateLimiter.from_config()
@@ -0,0 +1,72 @@
+# shared/redis_pool.py
+import os
+import time
+import threading
+import redis
+from shared.logger_config import logger
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))  # 프로세스 전체 연결 상한
+HEALTH_CHECK_INTERVAL = 10  # 헬스체크 결과 재사용 시간(초)
+
+_pools = {}
+_health = {}  # (host, port) → (healthy, checked_at)
+_lock = threading.Lock()
+
+
+def get_client(host: str = None, port: int = None) -> redis.Redis:
+    """
+    (host, port) 별 프로세스 공용 커넥션 풀을 쓰는 Redis 클라이언트.
+    클라이언트 생성 시점에는 연결하지 않고, 첫 명령 실행 시 연결한다.
+    """
+    key = (host or REDIS_HOST, int(port or REDIS_PORT))
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = redis.BlockingConnectionPool(
+                host=key[0],
+                port=key[1],
+                max_connections=MAX_CONNECTIONS,
+                timeout=5,                  # 풀이 가득 찼을 때 대기(초)
+                socket_timeout=2,
+                socket_connect_timeout=2,
+                health_check_interval=30,   # 오래 쉰 연결은 사용 전 PING
+                decode_responses=True,
+            )
+            _pools[key] = pool
+    return redis.Redis(connection_pool=pool)
+
+
+def is_healthy(host: str = None, port: int = None) -> bool:
+    """
+    Redis 사용 가능 여부 (PING).
+    결과를 HEALTH_CHECK_INTERVAL 동안 재사용해 장애 중에 매 호출마다
+    연결 시도/예외 비용을 치르지 않도록 한다.
+    """
+    key = (host or REDIS_HOST, int(port or REDIS_PORT))
+    now = time.monotonic()
+    healthy, checked_at = _health.get(key, (None, 0.0))
+    if healthy is not None and now - checked_at < HEALTH_CHECK_INTERVAL:
+        return healthy
+
+    try:
+        healthy = bool(get_client(*key).ping())
+        if _health.get(key, (None,))[0] is False:
+            logger.info(f"Redis 연결 복구 ({key[0]}:{key[1]})")
+    except Exception as e:
+        if _health.get(key, (None,))[0] is not False:
+            logger.error(f"Redis 연결 불가 ({key[0]}:{key[1]}): {e}")
+        healthy = False
+
+    _health[key] = (healthy, now)
+    return healthy
+
+
+def mark_unhealthy(host: str = None, port: int = None):
+    """명령 실행 중 연결 오류 발생 시 호출 → 다음 헬스체크까지 Redis 호출 생략"""
+    key = (host or REDIS_HOST, int(port or REDIS_PORT))
+    _health[key] = (False, time.monotonic())
@@ -0,0 +1,294 @@
+# shared/rss_engine.py
+"""
+설정 기반 공용 RSS 수집 엔진.
+
+소스별 피드 목록은 <소스>/config/feeds.json, 필드 매핑은 shared/config/sources.json 에 둔다.
+
+    "bloomberg": {
+        "name": "Bloomberg",                 # 로그/출력용 표시 이름
+        "feeds_key": "bloomberg",            # feeds.json 안의 키 (기본: 소스 이름, null 이면 파일 전체)
+        "scope": "bloomberg",                # Bloom/registry 키 접두어 (기본: feeds_key, 바꾸면 중복 기록 초기화)
+        "data_dir": "bloomberg",             # 저장 디렉터리 (기본: 소스 이름)
+        "resolve_google_links": true,        # Google News 링크 → 원문 URL
+        "parser": "stream",                  # 피드 파서 (기본: FEED_PARSER 환경변수)
+        "stop_after_duplicates": 0,          # 연속 중복 N개에서 중단 (기본: FEED_STOP_AFTER_DUPLICATES, 최신순이 아닌 피드는 0)
+        "fields": {
+            "clean_title": true,             # 제목에 HTML 이 섞여 오는 피드
+            "summary": ["summary"],          # 요약 후보 필드 (앞에서부터 처음 값이 있는 것)
+            "summary_or_title": false,       # 요약이 비면 제목으로 대체
+            "content": [],                   # 본문 후보 필드 ([] 이면 본문 없음, "summary" 는 위에서 고른 요약 원문)
+            "author": "Bloomberg News",      # 작성자 기본값
+            "published_fallback": true,      # published 없으면 updated → 수집 시각
+            "extra": {}                      # 모든 기사에 고정으로 넣을 필드
+        }
+    }
+
+링크 정리(추적 파라미터 제거 등)는 shared/config/url_rules.json 에서 처리한다.
+피드 파싱(feedparser/clean_html)은 shared/feed_parse.py, 여러 코어에서 돌리는 풀은 shared/parse_pool.py.
+"""
+import os
+import json
+import time
+import threading
+from itertools import islice
+from shared.utils import get_data_dir
+from shared.sinks import save_articles
+from shared.logger_config import logger
+from shared.bloom_filter import BloomFilter
+from shared.article_registry import registry, canonical_id
+from shared.near_dup import near_dups
+from shared.fetcher import fetch_feed, fetch_feeds, commit_feeds, FeedResponse
+from shared.gnews_resolver import resolve_links, defer_unresolved
+from shared.feed_parse import field_spec, iter_rows
+from shared.parse_pool import parse_pool
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+CRAWLER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+SOURCES_PATH = os.path.join(os.path.dirname(__file__), "config", "sources.json")
+
+# "stream" 이면 feedparser 대신 lxml iterparse 로 item 을 하나씩 읽음 (소스별 "parser" 로도 지정 가능)
+# 연속 중복 확인은 STREAM_CHUNK 개씩 해서 중단 지점 이후는 파싱하지 않음
+FEED_PARSER = os.getenv("FEED_PARSER", "feedparser")
+STREAM_CHUNK = int(os.getenv("FEED_STREAM_CHUNK", "20"))
+# 최신순 피드에서 이미 본 항목이 N개 연속이면 나머지는 이전 기사로 보고 중단 (0 이면 끝까지, 소스별 "stop_after_duplicates")
+STOP_AFTER_DUPLICATES = int(os.getenv("FEED_STOP_AFTER_DUPLICATES", "10"))
+
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+
+# RedisBloom (전체 소스 공용, 첫 요청 시 연결)
+bloom = BloomFilter()
+
+
+class RssSource:
+    """RSS 소스 하나 (feeds.json + 필드 매핑)"""
+
+    def __init__(self, source: str, spec: dict):
+        self.source = source
+        self.name = spec.get("name", source)
+        self.feeds_key = spec.get("feeds_key", source)
+        self.scope = spec.get("scope") or self.feeds_key or source
+        self.data_dir = get_data_dir(spec.get("data_dir", source))
+        self.config_path = os.path.join(CRAWLER_ROOT, source, "config", "feeds.json")
+        self.resolve_google_links = spec.get("resolve_google_links", False)
+        self.parser = spec.get("parser", FEED_PARSER)
+        self.stop_after = spec.get("stop_after_duplicates", STOP_AFTER_DUPLICATES)
+
+        self.fields = field_spec(spec.get("fields", {}))
+        self.extra = spec.get("fields", {}).get("extra", {})
+
+    # ───────── feeds.json 로드
+    def load_feeds(self) -> list:
+        """[(topic, url), ...] (main 이 있으면 맨 앞)"""
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+        feeds = cfg if self.feeds_key is None else cfg.get(self.feeds_key, {})
+        pairs = [("main", feeds["main"])] if feeds.get("main") else []
+        return pairs + list(feeds.get("topics", {}).items())
+
+    # ───────── 기사 구성
+    def build_article(self, row: tuple, topic: str, link: str) -> dict:
+        """기사 행 (shared/feed_parse.py) → 저장할 기사 dict"""
+        title, _, article_hash, summary, content, published, author, categories, image_url = row
+        article = {
+            "id": article_hash,
+            "canonical_id": canonical_id(link),
+            "topic": topic,
+            "title": title,
+            "link": link,
+            "summary": summary,
+            "content": content,
+            "published": published,
+            "author": author,
+            "categories": categories,
+            "collected_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        if image_url:
+            article["image_url"] = image_url
+        article.update(self.extra)
+        return article
+
+    # ───────── RSS 파서
+    def _rows(self, response: FeedResponse, parsed=None):
+        """
+        기사 행 (피드 순서대로).
+        워커 풀에 맡긴 결과가 있으면 그것을, 없으면 이 스레드에서 필요한 만큼만 파싱.
+        """
+        if parsed is not None:
+            rows = parse_pool.result(parsed)
+            if rows is not None:
+                return rows
+        return iter_rows(response.body, response.headers, self.parser, self.fields, self.name)
+
+    def _cutoff(self, scope: str, rows) -> list:
+        """
+        처리할 앞부분 행: 이미 본 항목이 stop_after 개 연속으로 나온 지점까지 (0 이면 전체).
+        Bloom 은 읽기 전용으로 조회하고 실제 추가는 _check_entries 에서 앞부분만 한 번에 한다.
+        이 스레드에서 stream 파싱 중이면 STREAM_CHUNK 개씩 읽으며 조회해 나머지는 파싱하지 않는다.
+        """
+        if not self.stop_after:
+            return list(rows)
+
+        size = STREAM_CHUNK if self.parser == "stream" and not isinstance(rows, list) else None
+        rows = iter(rows)
+        prefix, run = [], 0  # run: 이미 본 항목 연속 개수
+        while True:
+            chunk = list(islice(rows, size))
+            if not chunk:
+                return prefix
+            for row, seen in zip(chunk, bloom.exists_many(scope, [row[2] for row in chunk])):
+                prefix.append(row)
+                run = run + 1 if seen else 0
+                if run >= self.stop_after:
+                    return prefix
+
+    def _check_entries(self, topic: str, rows: list):
+        """행 목록 → (새 기사, 중복 수)"""
+        scope = f"{self.scope}:{topic}"
+
+        # 1) RedisBloom 중복 체크 (피드 전체를 한 번에)
+        is_new = bloom.add_many(scope, [row[2] for row in rows])
+        links = [row[1] for row in rows]
+        if self.resolve_google_links:
+            # 새 기사만 Google News 링크 → 원문 URL (해시는 원래 링크 기준 유지)
+            links = resolve_links(links, is_new)
+        # 다른 토픽/소스에서 이미 수집한 기사는 새로 기록하지 않고 소속 토픽만 추가
+        is_new = registry.claim_many(scope, links, is_new)
+
+        articles = []
+        duplicate_count = 0
+        for row, link, new in zip(rows, links, is_new):
+            if not new:
+                duplicate_count += 1
+                continue
+            articles.append(self.build_article(row, topic, link))
+
+        return articles, duplicate_count
+
+    def parse_feed(self, topic: str, url: str, response: FeedResponse = None, parsed=None):
+        """
+        피드 하나 → (새 기사, 중복 수)
+        parsed: 워커 풀에 미리 맡긴 파싱 작업 (parse_pool.submit 의 Future)
+        """
+        try:
+            fetched = response is None
+            response = response or fetch_feed(url)
+            result = self._process_feed(topic, url, response, parsed)
+            if fetched:
+                commit_feeds([response])
+            return result
+        except Exception as e:
+            logger.error(f"[{topic}] {self.name} RSS 파싱 오류: {e}")
+            return [], 0
+
+    def _process_feed(self, topic: str, url: str, response: FeedResponse, parsed=None):
+        """parse_feed 본체 (실패하면 예외 → 검증자를 저장하지 않음)"""
+        if response.not_modified:
+            # 지난 사이클 이후 변경 없음 → 파싱/해시/Bloom 체크 생략
+            return [], 0
+        if not response.ok:
+            logger.warning(f"[{topic}] {self.name} RSS 요청 실패 ({response.error or response.status}): {url}")
+            return [], 0
+
+        rows = self._cutoff(f"{self.scope}:{topic}", self._rows(response, parsed))
+        if not rows:
+            logger.warning(f"[{topic}] {self.name} RSS 빈 피드: {url}")
+            return [], 0
+
+        articles, duplicate_count = self._check_entries(topic, rows)
+
+        # 2) 제목+요약이 거의 같은 기사(다른 소스의 같은 기사 등)는 하나의 스토리로 묶고 제외
+        articles, near_count = near_dups.filter_articles(articles)
+        duplicate_count += near_count
+
+        return articles, duplicate_count
+
+    # ───────── 실행 루프
+    def run_cycle(self) -> dict:
+        feeds = self.load_feeds()
+
+        # 전체 피드 동시 다운로드
+        responses = fetch_feeds([url for _, url in feeds])
+
+        # 파싱은 워커 풀에 한꺼번에 넘김 (여러 소스의 피드가 코어를 나눠 씀), 중복 체크/저장은 아래에서 순서대로
+        # stream 파서는 중단 지점 이후를 파싱하지 않도록 풀에 넘기지 않고 이 스레드에서 필요한 만큼만 읽음
+        parsed = {}
+        if parse_pool.enabled and self.parser != "stream":
+            for url, res in responses.items():
+                if res.ok and not res.not_modified:
+                    parsed[url] = parse_pool.submit(res.body, res.headers, self.parser, self.fields, self.name)
+
+        success_topics, empty_topics = [], []
+        duplicate_stats = {}
+        processed = []  # 끝까지 처리한 응답 (검증자 저장 대상)
+
+        for topic, url in feeds:
+            try:
+                response = responses.get(url) or fetch_feed(url)
+                articles, dup = self._process_feed(topic, url, response, parsed.get(url))
+                duplicate_stats[topic] = dup
+                if articles:
+                    stream_dir = os.path.join(self.data_dir, topic)
+                    save_articles(articles, stream_dir)
+                    if self.resolve_google_links:
+                        # 바로 해석하지 못한 Google News 링크는 백그라운드에서 해석 후 기록 갱신
+                        defer_unresolved(f"{self.scope}:{topic}", stream_dir, articles)
+                    success_topics.append(f"{topic}({len(articles)})")
+                else:
+                    empty_topics.append(topic)
+                processed.append(response)
+            except Exception as e:
+                logger.error(f"[{topic}] {self.name} 피드 오류: {e}")
+                empty_topics.append(topic)
+
+        commit_feeds(processed)
+
+        # ───────── 결과 출력 (여러 소스가 동시에 돌아도 섞이지 않게 한 번에 출력)
+        lines = [
+            f"{BLUE}────────────────────────────────────────────{RESET}",
+            f"{CYAN}{self.name} Feed Parsing | {time.strftime('%Y-%m-%d %H:%M:%S')}{RESET}",
+            f"{BLUE}────────────────────────────────────────────{RESET}",
+            f"{GREEN}✔ Success".ljust(15) + f"{', '.join(success_topics) or '-'}{RESET}",
+            f"{YELLOW}⚠ Empty".ljust(15) + f"{', '.join(empty_topics) or '-'}{RESET}",
+            f"{CYAN}🧠 Duplicates{RESET}".ljust(15),
+        ]
+        lines += [f"   {topic}: {YELLOW}{c}{RESET} 중복" for topic, c in duplicate_stats.items() if c > 0]
+        lines += [
+            f"{BLUE}────────────────────────────────────────────{RESET}",
+            f"✅ Completed | {GREEN}{len(success_topics)} 성공{RESET} | {YELLOW}{len(empty_topics)} 실패{RESET}",
+            f"{BLUE}────────────────────────────────────────────{RESET}",
+        ]
+        print("\n".join(lines))
+
+        return {"success": success_topics, "empty": empty_topics, "duplicates": duplicate_stats}
+
+
+# ───────────────────────────────
+# 소스 목록 (프로세스 공용)
+# ───────────────────────────────
+_sources = None
+_lock = threading.Lock()
+
+
+def load_sources() -> dict:
+    """sources.json 의 전체 소스 → {source: RssSource}"""
+    global _sources
+    with _lock:
+        if _sources is None:
+            with open(SOURCES_PATH, "r", encoding="utf-8") as f:
+                specs = json.load(f)
+            _sources = {source: RssSource(source, spec) for source, spec in specs.items()}
+        return _sources
+
+
+def get_source(source: str) -> RssSource:
+    """
+    소스 하나 조회
+    예: get_source("cnbc").run_cycle()
+    """
+    return load_sources()[source]
@@ -0,0 +1,275 @@
+# shared/segment_store.py
+import os
+import glob
+import json
+import time
+import atexit
+import itertools
+import threading
+from collections import OrderedDict
+from shared.logger_config import logger
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+SEGMENT_MAX_BYTES = int(os.getenv("SEGMENT_MAX_BYTES", str(64 * 1024 * 1024)))  # 크기 기준 교체
+SEGMENT_MAX_AGE = int(os.getenv("SEGMENT_MAX_AGE", "3600"))                      # 시간 기준 교체(초)
+FSYNC_BYTES = 1024 * 1024     # 이만큼 쓰면 fsync
+FSYNC_INTERVAL = 5            # 마지막 fsync 후 이 시간이 지나면 fsync(초)
+MAX_OPEN = 128                # 동시에 열어둘 파일 수 (넘으면 오래 안 쓴 것부터 닫음)
+ROLL_CHECK_INTERVAL = 60      # 오래된 세그먼트 정리 주기(초)
+
+OPEN_SUFFIX = ".jsonl.part"   # 쓰는 중인 세그먼트
+DONE_SUFFIX = ".jsonl"        # 완료된 세그먼트 (읽기/압축 대상)
+
+_seq = itertools.count()      # 같은 초에 세그먼트가 여러 개 생겨도 이름이 겹치지 않도록
+
+
+def _pid_alive(pid: int) -> bool:
+    """프로세스 실행 중 여부 (권한이 없어 확인 못 하면 실행 중으로 간주)"""
+    if os.name == "nt":
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _owner_pid(path: str):
+    """<시각>-<pid>-<번호>.jsonl.part → pid (형식이 다르면 None)"""
+    parts = os.path.basename(path)[: -len(OPEN_SUFFIX)].split("-")
+    try:
+        return int(parts[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def _finalize(path: str):
+    """쓰다 만 세그먼트 완료 처리 (마지막 줄이 잘렸으면 잘라냄)"""
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        # 끝에서부터 마지막 줄바꿈 위치 탐색 (정상 종료면 마지막 1바이트만 확인)
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            chunk = f.read(end - start)
+            pos = chunk.rfind(b"\n")
+            if pos >= 0:
+                end = start + pos + 1
+                break
+            end = start
+        f.truncate(end)
+        f.flush()
+        os.fsync(f.fileno())
+    if end == 0:
+        os.remove(path)
+    else:
+        os.replace(path, path[: -len(OPEN_SUFFIX)] + DONE_SUFFIX)
+
+
+class SegmentWriter:
+    """
+    스트림(디렉터리) 하나에 대한 append-only JSONL 세그먼트 기록기.
+    <stream>/<시각>-<pid>-<번호>.jsonl.part 에 이어 쓰다가 크기/시간 한도를 넘으면
+    .jsonl 로 이름을 바꿔 완료하고 새 세그먼트를 연다.
+    fsync 는 FSYNC_BYTES / FSYNC_INTERVAL 단위로 모아서 한다.
+    """
+
+    def __init__(self, stream_dir: str, max_bytes: int = SEGMENT_MAX_BYTES, max_age: int = SEGMENT_MAX_AGE):
+        self.stream_dir = stream_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.path = None
+        self.opened_at = 0.0
+        self.size = 0
+        self._file = None
+        self._unsynced = 0
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(stream_dir, exist_ok=True)
+        self._recover()
+
+    def _recover(self):
+        """
+        종료된 프로세스가 남긴 .part 만 완료 처리.
+        소스별 main.py 를 orchestrator 와 따로 돌리면 같은 스트림에 다른 프로세스가 쓰는 중일 수 있으므로
+        이름의 pid 가 살아 있으면 건드리지 않는다 (이 프로세스의 스트림당 기록기는 지금 만드는 것 하나뿐이라
+        같은 pid 의 .part 는 pid 를 재사용한 이전 실행이 남긴 것).
+        """
+        for path in glob.glob(os.path.join(self.stream_dir, f"*{OPEN_SUFFIX}")):
+            pid = _owner_pid(path)
+            if pid is not None and pid != os.getpid() and _pid_alive(pid):
+                continue
+            try:
+                _finalize(path)
+            except Exception as e:
+                logger.warning(f"세그먼트 복구 실패: {path} ({e})")
+
+    def _open(self):
+        if self.path is None:
+            name = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}-{next(_seq):06d}{OPEN_SUFFIX}"
+            self.path = os.path.join(self.stream_dir, name)
+            self.opened_at = time.time()
+            self.size = 0
+        self._file = open(self.path, "ab")
+        self._synced_at = time.monotonic()
+
+    def _sync(self):
+        if self._file and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._synced_at = time.monotonic()
+
+    def _detach(self):
+        # 파일 핸들만 닫음 (세그먼트는 계속 .part 로 유지)
+        if self._file:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def _roll(self):
+        self._detach()
+        if self.path:
+            _finalize(self.path)
+            self.path = None
+
+    def expired(self) -> bool:
+        return self.path is not None and (
+            self.size >= self.max_bytes or time.time() - self.opened_at >= self.max_age
+        )
+
+    def append(self, records: list) -> int:
+        """레코드를 한 줄씩 추가 → 기록한 바이트 수"""
+        data = b"".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for r in records
+        )
+        with self._lock:
+            if self.expired():
+                self._roll()
+            if self._file is None:
+                self._open()
+            self._file.write(data)
+            self._file.flush()
+            self.size += len(data)
+            self._unsynced += len(data)
+            if self._unsynced >= FSYNC_BYTES or time.monotonic() - self._synced_at >= FSYNC_INTERVAL:
+                self._sync()
+        return len(data)
+
+    def detach(self):
+        with self._lock:
+            self._detach()
+
+    def sync_if_due(self):
+        """새 쓰기가 없어도 FSYNC_INTERVAL 이 지난 데이터는 디스크에 반영"""
+        with self._lock:
+            if self._unsynced and time.monotonic() - self._synced_at >= FSYNC_INTERVAL:
+                self._sync()
+
+    def roll_if_expired(self):
+        with self._lock:
+            if self.expired():
+                self._roll()
+
+    def close(self):
+        """현재 세그먼트 완료 처리"""
+        with self._lock:
+            self._roll()
+
+
+class SegmentStore:
+    """
+    스트림별 SegmentWriter 관리 (열린 파일 수 제한 + 주기적 시간 교체).
+    백그라운드 스레드가 FSYNC_INTERVAL 마다 밀린 fsync 를, ROLL_CHECK_INTERVAL 마다 시간 교체를 처리해
+    마지막 배치가 다음 쓰기까지 디스크에 반영되지 않은 채 남지 않는다.
+    """
+
+    def __init__(self, max_open: int = MAX_OPEN):
+        self.max_open = max_open
+        self._writers = OrderedDict()
+        self._lock = threading.Lock()
+        self._checked_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _ensure_started(self):
+        # self._lock 안에서 호출
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="segment-sync", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(FSYNC_INTERVAL):
+            with self._lock:
+                writers = list(self._writers.values())
+            for w in writers:
+                try:
+                    w.sync_if_due()
+                except Exception as e:
+                    logger.warning(f"세그먼트 fsync 실패: {w.stream_dir} ({e})")
+            if time.monotonic() - self._checked_at >= ROLL_CHECK_INTERVAL:
+                self._checked_at = time.monotonic()
+                try:
+                    self.roll_expired()
+                except Exception as e:
+                    logger.warning(f"세그먼트 교체 실패: {e}")
+
+    def writer(self, stream_dir: str) -> SegmentWriter:
+        stream_dir = os.path.abspath(stream_dir)
+        with self._lock:
+            writer = self._writers.get(stream_dir)
+            if writer is None:
+                writer = self._writers[stream_dir] = SegmentWriter(stream_dir)
+                self._ensure_started()
+            self._writers.move_to_end(stream_dir)
+            idle = list(self._writers.values())[: max(0, len(self._writers) - self.max_open)]
+        for w in idle:
+            w.detach()
+        return writer
+
+    def append(self, records: list, stream_dir: str) -> int:
+        if not records:
+            return 0
+        return self.writer(stream_dir).append(records)
+
+    def roll_expired(self):
+        """쓰기가 없어도 시간 한도를 넘긴 세그먼트는 완료 처리"""
+        with self._lock:
+            writers = list(self._writers.values())
+        for w in writers:
+            w.roll_if_expired()
+
+    def close_all(self):
+        self._stop.set()
+        with self._lock:
+            writers = list(self._writers.values())
+        for w in writers:
+            try:
+                w.close()
+            except Exception as e:
+                logger.warning(f"세그먼트 종료 실패: {w.stream_dir} ({e})")
+
+
+# ───────────────────────────────
+# 프로세스 공용 저장소
+# ───────────────────────────────
+store = SegmentStore()
+atexit.register(store.close_all)
+
+
+def append_records(records: list, stream_dir: str) -> int:
+    """
+    기사 목록을 스트림 디렉터리의 현재 세그먼트에 추가 (빈 목록은 무시)
+    예: append_records(articles, os.path.join(DATA_DIR, topic))
+    """
+    return store.append(records, stream_dir)
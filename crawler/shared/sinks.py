@@ -0,0 +1,201 @@
+# shared/sinks.py
+import os
+import time
+import queue
+import atexit
+import threading
+from shared.logger_config import logger
+from shared.utils import get_data_dir
+from shared.segment_store import append_records
+from shared.kafka_sink import KafkaSink
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+# JSONL 세그먼트 외에 기사를 함께 보낼 곳 (쉼표 구분, 빈 값이면 세그먼트만)
+# 예: ARTICLE_SINKS=sqlite,kafka,postgres
+ARTICLE_SINKS = [s.strip() for s in os.getenv("ARTICLE_SINKS", "sqlite").split(",") if s.strip()]
+# 1 이면 저장(디스크/sink I/O)을 백그라운드 스레드에서 처리 → 수집 루프는 큐에 넣고 바로 진행
+WRITE_ASYNC = os.getenv("ARTICLE_WRITE_ASYNC", "1") == "1"
+WRITE_QUEUE_SIZE = int(os.getenv("ARTICLE_WRITE_QUEUE_SIZE", "256"))  # 대기 배치 수 (가득 차면 수집 쪽이 대기)
+
+
+class SqliteSink:
+    """로컬 SQLite/FTS5 인덱스"""
+
+    def __init__(self):
+        from shared.article_index import ArticleIndex
+        self.index = ArticleIndex()
+
+    def write(self, source: str, articles: list):
+        self.index.upsert_many(source, articles)
+
+    def add_memberships(self, records: list):
+        self.index.add_memberships(records)
+
+    def close(self):
+        self.index.close()
+
+
+class PostgresSink:
+    """Postgres (COPY → 임시 테이블 → upsert)"""
+
+    def __init__(self):
+        from shared.pg_loader import PostgresLoader
+        self.loader = PostgresLoader()
+
+    def write(self, source: str, articles: list):
+        self.loader.upsert_many(source, articles)
+
+    def add_memberships(self, records: list):
+        self.loader.add_memberships(records)
+
+    def close(self):
+        self.loader.close()
+
+
+SINK_TYPES = {
+    "sqlite": SqliteSink,
+    "kafka": KafkaSink,
+    "postgres": PostgresSink,
+}
+
+_sinks = None
+_lock = threading.Lock()
+
+
+def get_sinks() -> list:
+    """설정된 sink 목록 (첫 호출 시 생성, 생성 실패한 sink 는 제외)"""
+    global _sinks
+    with _lock:
+        if _sinks is None:
+            _sinks = []
+            for name in ARTICLE_SINKS:
+                try:
+                    _sinks.append(SINK_TYPES[name]())
+                except Exception as e:
+                    logger.error(f"sink 초기화 실패 ({name}): {e}")
+        return _sinks
+
+
+def source_of(stream_dir: str) -> str:
+    """<crawler>/<source>/data/<topic> → source"""
+    return os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(stream_dir))))
+
+
+def _write(articles: list, stream_dir: str):
+    """JSONL 세그먼트(기본 저장소) + 설정된 sink 들 (sink 오류는 로그만 남김)"""
+    append_records(articles, stream_dir)
+
+    source = source_of(stream_dir)
+    for sink in get_sinks():
+        try:
+            sink.write(source, articles)
+        except Exception as e:
+            logger.error(f"[{source}] {type(sink).__name__} 저장 실패: {e}")
+
+
+def _write_memberships(records: list):
+    """기사 소속 기록: shared/data/article_topics 세그먼트 + add_memberships 를 지원하는 sink 들"""
+    append_records(records, os.path.join(get_data_dir("shared"), "article_topics"))
+
+    for sink in get_sinks():
+        add = getattr(sink, "add_memberships", None)
+        if add is None:
+            continue
+        try:
+            add(records)
+        except Exception as e:
+            logger.error(f"{type(sink).__name__} 소속 저장 실패: {e}")
+
+
+class ArticleWriter:
+    """
+    저장 전용 백그라운드 스레드.
+    배치는 들어온 순서대로 기록되고, 큐가 가득 차면 submit 이 대기한다.
+    """
+
+    def __init__(self, maxsize: int = WRITE_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="article-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                func, args = item
+                func(*args)
+            except Exception as e:
+                logger.error(f"기사 저장 실패 ({item[0].__name__}): {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, func, *args):
+        """func(*args) 를 저장 스레드에서 실행"""
+        self._ensure_started()
+        self._queue.put((func, args))
+
+    def flush(self):
+        """지금까지 넣은 배치가 모두 기록될 때까지 대기"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
+writer = ArticleWriter()
+
+
+def save_articles(articles: list, stream_dir: str):
+    """
+    수집 기사 저장: JSONL 세그먼트(기본 저장소) + 설정된 sink 들
+    WRITE_ASYNC 면 백그라운드 스레드로 넘기고 바로 반환한다.
+    """
+    if not articles:
+        return
+    if WRITE_ASYNC:
+        writer.submit(_write, articles, stream_dir)
+    else:
+        _write(articles, stream_dir)
+
+
+def save_memberships(scope: str, canonical_ids: list):
+    """
+    기사 소속 저장 (같은 기사가 다른 토픽/소스에도 있다는 기록, 기사 본문은 중복 저장하지 않음)
+    기사 쪽에는 같은 canonical_id 필드가 있어 둘을 이어 볼 수 있다.
+    """
+    if not canonical_ids:
+        return
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    records = [{"canonical_id": cid, "scope": scope, "collected_at": now} for cid in canonical_ids]
+    if WRITE_ASYNC:
+        writer.submit(_write_memberships, records)
+    else:
+        _write_memberships(records)
+
+
+def _shutdown():
+    # 남은 배치 기록 → sink 종료 (세그먼트 종료는 segment_store 의 atexit 이 이후에 처리)
+    writer.close()
+    for sink in _sinks or []:
+        close = getattr(sink, "close", None)
+        if close:
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"{type(sink).__name__} 종료 실패: {e}")
+
+
+atexit.register(_shutdown)
@@ -0,0 +1,135 @@
+# shared/url_normalizer.py
+import os
+import re
+import json
+import threading
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from shared.logger_config import logger
+
+# ───────────────────────────────
+# 기본 설정
+# ───────────────────────────────
+CONFIG_PATH = os.getenv(
+    "URL_RULES_CONFIG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "url_rules.json"),
+)
+CACHE_SIZE = 65536  # 정규화 결과 캐시 (같은 링크가 매 사이클 반복 등장)
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+class HostRule:
+    """호스트 하나에 적용할 정규화 규칙 (정규식은 생성 시 한 번만 컴파일)"""
+
+    def __init__(self, default: dict, override: dict = None):
+        override = override or {}
+        self.drop_query = override.get("drop_query", default.get("drop_query", False))
+        params = default.get("drop_params", []) + override.get("drop_params", [])
+        self.drop_params = re.compile("|".join(f"(?:{p})" for p in params), re.I) if params else None
+        self.path_rules = [
+            (re.compile(pattern), repl)
+            for pattern, repl in default.get("path_rules", []) + override.get("path_rules", [])
+        ]
+
+    def clean_query(self, query: str) -> str:
+        if self.drop_query or not query:
+            return ""
+        pairs = parse_qsl(query, keep_blank_values=True)
+        if self.drop_params:
+            pairs = [(k, v) for k, v in pairs if not self.drop_params.fullmatch(k)]
+        return urlencode(sorted(pairs))
+
+    def clean_path(self, path: str) -> str:
+        for pattern, repl in self.path_rules:
+            path = pattern.sub(repl, path)
+        return path
+
+
+class UrlNormalizer:
+    """
+    규칙 기반 URL 정규화.
+    url_rules.json 의 hosts 는 도메인 단위로 매칭되어 하위 도메인에도 적용된다
+    (예: "wsj.com" → www.wsj.com, on.wsj.com). 없는 호스트는 default 규칙만 사용.
+    """
+
+    def __init__(self, hosts: dict = None, default: dict = None):
+        self.hosts = {h.lower(): r for h, r in (hosts or {}).items()}
+        self.default = default or {}
+        self._rules = {}  # host → HostRule (컴파일된 규칙 캐시)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, path: str = CONFIG_PATH):
+        """설정 파일 로드 (없거나 깨져 있으면 기본 규칙 없이 동작)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
+            return cls(cfg.get("hosts", {}), cfg.get("default"))
+        except Exception as e:
+            logger.warning(f"URL 정규화 규칙 로드 실패 → 기본값 사용 ({e})")
+            return cls()
+
+    def rule_for(self, host: str) -> HostRule:
+        rule = self._rules.get(host)
+        if rule is None:
+            override = None
+            labels = host.split(".")
+            for i in range(len(labels) - 1):
+                override = self.hosts.get(".".join(labels[i:]))
+                if override is not None:
+                    break
+            rule = HostRule(self.default, override)
+            with self._lock:
+                self._rules[host] = rule
+        return rule
+
+    def normalize(self, url: str) -> str:
+        """
+        저장용 정규 URL
+        - scheme/host 소문자, 기본 포트 제거, fragment 제거
+        - 추적 파라미터 제거 후 남은 파라미터는 정렬
+        """
+        url = url.strip()
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            # 잘못된 포트/IPv6 주소 등 → 그대로 둠 (피드 전체가 실패하지 않게)
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return url
+
+        host = parts.hostname.lower()
+        netloc = host if port is None or str(port) == DEFAULT_PORTS[scheme] else f"{host}:{port}"
+        rule = self.rule_for(host[4:] if host.startswith("www.") else host)
+        path = rule.clean_path(parts.path) or "/"
+        return urlunsplit((scheme, netloc, path, rule.clean_query(parts.query), ""))
+
+
+# ───────────────────────────────
+# 프로세스 공용 인스턴스
+# ───────────────────────────────
+normalizer = UrlNormalizer.from_config()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_url(url: str) -> str:
+    """수집 기사 링크 정규화 (기사에 저장되는 link)"""
+    if not url:
+        return ""
+    return normalizer.normalize(url)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def url_key(url: str) -> str:
+    """
+    중복 판정용 키: 정규 URL 에서 scheme, www., 끝의 '/' 차이까지 무시
+    예: http://www.wsj.com/articles/x/?mod=rss → wsj.com/articles/x
+    """
+    parts = urlsplit(canonical_url(url))
+    if not parts.netloc:
+        return parts.geturl()
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    key = host + (parts.path.rstrip("/") or "")
+    return f"{key}?{parts.query}" if parts.query else key
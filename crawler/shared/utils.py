@@ -1,16 +1,59 @@
 import os
 import json
 import logging
+import tempfile
+
+# 새 파일 기본 권한 계산용 umask (os.umask 는 바꿔야만 읽을 수 있어 스레드가 생기기 전인 import 시점에 한 번만 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_json(data, path, indent=2):
+    """
+    임시 파일에 쓰고 fsync 후 rename → 읽는 쪽은 이전 파일 또는 완성된 새 파일만 본다.
+    (중간에 프로세스가 죽어도 대상 파일이 잘리지 않음)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp 은 0600 으로 만들므로 기존 파일 권한(없으면 일반 파일 기본값)으로 맞춤
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # rename 자체도 디스크에 반영 (디렉터리 fsync, 지원하지 않는 OS 는 건너뜀)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 def save_json(data, path):
-    """데이터가 있을 때만 JSON 파일로 저장"""
+    """데이터가 있을 때만 JSON 파일로 저장 (원자적 교체)"""
     if not data:  # 빈 리스트나 None이면 저장하지 않음
         return
 
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    atomic_write_json(data, path)
 
 
 def get_data_dir(module_name: str):
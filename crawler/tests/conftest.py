@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# 수집기와 같이 crawler/ 를 기준으로 shared.* 를 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
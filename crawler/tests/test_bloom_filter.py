@@ -0,0 +1,184 @@
+# tests/test_bloom_filter.py
+import hashlib
+import pytest
+import redis
+import fakeredis
+from shared import bloom_filter as bfm
+from shared.bloom_filter import BloomFilter, GENERATION_SECONDS, GENERATIONS
+from shared.local_filter import RecentHashCache
+from shared.offline_bloom import OfflineBloomFilter
+
+KEY = "rss_seen:test:main"
+
+
+def h(i: int) -> str:
+    # 기사 해시 (LRU 는 앞 32자만 보므로 실제처럼 sha256 hex 사용)
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+class Clock:
+    """세대 계산용 time.time 대역 (기간 단위로 앞당김)"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, generations: int):
+        self.now += GENERATION_SECONDS * generations
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """RedisBloom 대역(fakeredis) + 임시 경로 오프라인 필터 + 비운 LRU + 조절 가능한 시계/헬스 상태"""
+    state = {"healthy": True}
+    clock = Clock()
+    offline = OfflineBloomFilter(str(tmp_path / "offline_bloom.bin"), capacity=10000)
+    monkeypatch.setattr(bfm.time, "time", clock)
+    monkeypatch.setattr(bfm, "is_healthy", lambda *a: state["healthy"])
+    monkeypatch.setattr(bfm, "mark_unhealthy", lambda *a: state.update(healthy=False))
+    monkeypatch.setattr(bfm, "get_offline_filter", lambda: offline)
+    monkeypatch.setattr(bfm, "recent", RecentHashCache())
+
+    bloom = BloomFilter()
+    bloom.client = fakeredis.FakeRedis(decode_responses=True)
+    return bloom, offline, clock, state
+
+
+def restart():
+    """프로세스 재시작 (로컬 LRU 만 비워짐)"""
+    bfm.recent = RecentHashCache()
+
+
+def test_new_then_duplicate(env):
+    bloom, *_ = env
+    assert bloom.add_many(KEY, [h(1), h(2)]) == [True, True]
+    assert bloom.add_many(KEY, [h(1), h(3)]) == [False, True]
+    restart()
+    assert bloom.add_many(KEY, [h(1), h(2), h(3)]) == [False, False, False]
+    assert bloom.add_many(KEY, []) == []
+
+
+def test_exists_many_is_read_only(env):
+    bloom, *_ = env
+    bloom.add_many(KEY, [h(1)])
+    restart()
+    assert bloom.exists_many(KEY, [h(1), h(2)]) == [True, False]
+    assert bloom.exists_many(KEY, [h(2)]) == [False]
+    assert bloom.add_many(KEY, [h(2)]) == [True]
+
+
+def test_value_expires_after_all_generations(env):
+    bloom, _, clock, _ = env
+    bloom.add_many(KEY, [h(1)])
+
+    clock.advance(GENERATIONS - 1)
+    restart()
+    assert bloom.exists_many(KEY, [h(1)]) == [True]   # 가장 오래된 세대에 아직 있음
+
+    clock.advance(1)
+    restart()
+    assert bloom.exists_many(KEY, [h(1)]) == [False]  # 세대 범위를 벗어남 → 새 기사
+
+
+def test_reinsert_keeps_value_in_latest_generation(env):
+    bloom, _, clock, _ = env
+    # 피드에 계속 남아 있는 기사: 매 기간 다시 들어가 만료되지 않음
+    assert bloom.add_many(KEY, [h(1)]) == [True]
+    for _ in range(GENERATIONS * 2):
+        clock.advance(1)
+        assert bloom.add_many(KEY, [h(1)]) == [False]
+    current = bloom.generation_keys(KEY)[0]
+    assert bloom.client.bf().exists(current, h(1))
+    assert bloom.client.ttl(current) > 0
+
+
+def test_lru_is_scoped_to_generation(env):
+    bloom, _, clock, _ = env
+    bloom.add_many(KEY, [h(1)])
+    clock.advance(1)
+    # 재시작 없이도 새 세대에서는 LRU 를 건너뛰고 Redis 최신 세대에 다시 기록
+    assert bloom.add_many(KEY, [h(1)]) == [False]
+    assert bloom.client.bf().exists(bloom.generation_keys(KEY)[0], h(1))
+
+
+def test_legacy_single_filter_is_still_read(env):
+    bloom, *_ = env
+    bloom.client.bf().add(KEY, h(1))
+    assert bloom.add_many(KEY, [h(1), h(2)]) == [False, True]
+
+
+def test_offline_during_outage_and_reconcile_after(env):
+    bloom, offline, _, state = env
+    bloom.add_many(KEY, [h(1)])  # 평소: 오프라인 필터에도 그림자 기록
+
+    state["healthy"] = False
+    assert bloom.add_many(KEY, [h(1), h(2)]) == [False, True]
+    assert bloom.add_many(KEY, [h(2)]) == [False]
+    assert bloom.exists_many(KEY, [h(2), h(3)]) == [True, False]
+    assert offline.has_pending()
+    assert not bloom.client.bf().exists(bloom.generation_keys(KEY)[0], h(2))
+
+    # 복구 후 첫 쓰기에서 장애 중 값이 RedisBloom 최신 세대로 반영
+    state["healthy"] = True
+    assert bloom.add_many("rss_seen:other", [h(9)]) == [True]
+    assert not offline.has_pending()
+    assert bloom.client.bf().exists(bloom.generation_keys(KEY)[0], h(2))
+    restart()
+    assert bloom.add_many(KEY, [h(2)]) == [False]
+
+
+def test_failed_reconcile_keeps_pending(env, monkeypatch):
+    bloom, offline, _, state = env
+    state["healthy"] = False
+    bloom.add_many(KEY, [h(1)])
+
+    state["healthy"] = True
+    broken = bloom.client.pipeline
+
+    def pipeline(*args, **kwargs):
+        pipe = broken(*args, **kwargs)
+        pipe.execute = lambda: (_ for _ in ()).throw(redis.ConnectionError("down again"))
+        return pipe
+
+    monkeypatch.setattr(bloom.client, "pipeline", pipeline)
+    # Redis 쓰기 실패 → 오프라인 판정으로 대체, 반영 못 한 값은 pending 에 남음
+    assert bloom.add_many(KEY, [h(1), h(2)]) == [False, True]
+    assert state["healthy"] is False
+    assert offline.drain_pending() == {KEY: [h(1), h(2)]}
+
+
+def test_offline_filter_survives_reopen(tmp_path):
+    path = str(tmp_path / "offline.bin")
+    f = OfflineBloomFilter(path, capacity=1000)
+    assert f.add_many("k", ["a", "b"]) == [True, True]
+    assert f.add_many("k", ["a"], pending=True) == [False]
+    assert not f.has_pending()  # 이미 있던 값은 pending 에 넣지 않음
+    f.flush()
+
+    reopened = OfflineBloomFilter(path, capacity=1000)
+    assert reopened.contains("k", "a") and not reopened.contains("other", "a")
+    assert reopened.count == 2
+
+    # 설정(용량)이 바뀌면 빈 필터로 다시 시작
+    assert not OfflineBloomFilter(path, capacity=5000).contains("k", "a")
+
+
+def test_offline_pending_round_trip(tmp_path):
+    f = OfflineBloomFilter(str(tmp_path / "offline.bin"), capacity=1000)
+    f.add_many("k1", ["a", "b"], pending=True)
+    f.add_many("k2", ["c"], pending=True)
+    grouped = f.drain_pending()
+    assert grouped == {"k1": ["a", "b"], "k2": ["c"]}
+    assert not f.has_pending() and f.drain_pending() == {}
+    f.restore_pending(grouped)
+    assert f.drain_pending() == grouped
+
+
+def test_offline_filter_resets_when_saturated(tmp_path):
+    f = OfflineBloomFilter(str(tmp_path / "offline.bin"), capacity=10)
+    f.add_many("k", [str(i) for i in range(10)])
+    assert f.count == 10
+    assert f.add_many("k", ["0"]) == [True]  # 포화 → 비우고 다시 시작
+    assert f.count == 1
@@ -0,0 +1,74 @@
+# tests/test_feed_stream.py
+import pytest
+from shared.feed_parse import field_spec, iter_rows, parse_rows
+
+# stream 파서(lxml) 결과가 feedparser 와 같아야 함 → 파서 설정을 바꿔도 같은 기사가 같은 해시
+SPEC = field_spec({})
+
+RSS = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"'
+    ' xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>c</title>{}</channel></rss>'
+)
+ATOM = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">{}</feed>'
+)
+
+
+def item(title: str, link: str, extra: str = "") -> str:
+    return f"<item><title>{title}</title><link>{link}</link>{extra}</item>"
+
+
+ITEMS = {
+    "plain": item("Plain title", "https://x.com/a"),
+    "raw_amp_title": item("AT&T raw", "https://x.com/a"),
+    "raw_amp_link": item("Q", "https://x.com/a?x=1&y=2"),
+    "named_entity": item("It&rsquo;s &mdash; here", "https://x.com/a"),
+    "escaped_entity": item("It&amp;rsquo;s", "https://x.com/a"),
+    "cdata": item("<![CDATA[A <b>b</b> &amp; c]]>", "https://x.com/a"),
+    "cdata_link": item("C", "<![CDATA[https://x.com/a?x=1&y=2]]>"),
+    "author_then_creator": item("A", "https://x.com/a", "<author>a@x.com (Ann)</author><dc:creator>Bob</dc:creator>"),
+    "creator_then_author": item("A", "https://x.com/a", "<dc:creator>Bob</dc:creator><author>a@x.com (Ann)</author>"),
+    "guid_link": "<item><title>G</title><guid>https://x.com/g</guid></item>",
+    "whitespace": item("  A\n b ", " https://x.com/a "),
+}
+
+
+def feed(*items: str) -> bytes:
+    return RSS.format("".join(items)).encode("utf-8")
+
+
+def rows(body: bytes, parser: str) -> list:
+    # 행 = (title, link, id, summary, content, published, author, categories, image_url)
+    return parse_rows(body, {}, parser, SPEC)
+
+
+@pytest.mark.parametrize("name", ITEMS)
+def test_rows_match_feedparser(name):
+    body = feed(ITEMS["plain"], ITEMS[name])
+    assert rows(body, "stream") == rows(body, "feedparser")
+
+
+def test_all_cases_in_one_feed():
+    body = feed(*ITEMS.values())
+    assert rows(body, "stream") == rows(body, "feedparser")
+
+
+@pytest.mark.parametrize("entry", [
+    '<entry><title>A</title><link href="https://x.com/a"/><author><name>Ann</name></author><dc:creator>Bob</dc:creator></entry>',
+    '<entry><title type="html">A &amp;amp; b</title><link rel="alternate" href="https://x.com/b"/></entry>',
+])
+def test_atom_matches_feedparser(entry):
+    body = ATOM.format(entry).encode("utf-8")
+    assert rows(body, "stream") == rows(body, "feedparser")
+
+
+def test_error_after_items_falls_back_without_repeating():
+    # 앞부분을 이미 넘긴 뒤 뒤쪽 item 에서 XML 오류 → 나머지만 feedparser 로
+    good = [item(f"Title {i} " + "x" * 200, f"https://x.com/{i}") for i in range(500)]
+    body = feed(*good, ITEMS["raw_amp_title"])
+    rows_iter = iter_rows(body, {}, "stream", SPEC)
+    first = next(rows_iter)
+    assert [first, *rows_iter] == rows(body, "feedparser")
+    assert len(rows(body, "stream")) == 501
@@ -0,0 +1,67 @@
+# tests/test_html_text.py
+import random
+import pytest
+from bs4 import BeautifulSoup
+from shared.html_text import clean_html
+
+# fuzz 조각 (BeautifulSoup 과 결과가 같아야 함)
+#  - 엔티티는 세미콜론으로 끝나는 것만 (나머지는 아래 test_entities_follow_html5)
+#  - <template> 는 첫 </template> 까지 제외하는 근사 처리라 fuzz 에서 제외
+PARTS = [
+    "<!--", "-->", "<!-- c -->", "<!--x->", "<![CDATA[", "]]>", "<!x>", "<?x?>", "<!DOCTYPE html>",
+    "<script>", "</script>", "<style>", "</style>",
+    "<p>", "</p>", "<P>", "<p/>", "</p x>", "<b>", "</b>", "</ b >", "<br/>", "<img src=x>",
+    "<a href='x>y'>", '<a href="q">', "<a\nhref=1>", "</a>",
+    "</ p>", "</3", "</1>", "</", "</>", "< p>", "x<y", "x>y", "a<>b",
+    "&amp;", "&nbsp;", "&lt;", "&#39;", "&#x27;", "&copy;",
+    " ", "\n", "\t", "word", "ünï",
+]
+
+
+def reference(raw_html: str) -> str:
+    if not raw_html:
+        return ""
+    return " ".join(BeautifulSoup(raw_html, "html.parser").get_text(separator=" ", strip=True).split())
+
+
+@pytest.mark.parametrize("raw_html", [
+    "plain title",
+    "AT&amp;T deal &nbsp; x",
+    "a < b and c > d",
+    "<p>Hello <b>wor</b>ld</p>",
+    '<a title="a>b" href="x">link</a> tail',
+    "<script>var a=1<2;</script>txt",
+    "<![CDATA[zz]]>after",
+    "&lt;b&gt;escaped&lt;/b&gt;",
+    "text <b",
+    "<p>unclosed <b>bold",
+    "AT&amp;T</ p>",
+    "</<a href='x>y'>",
+    "a</>b",
+    "<template>t</template>u",
+    "<p>The post <a href=\"https://x\">Y</a> appeared first on <a>Z</a>.</p>",
+])
+def test_matches_beautifulsoup(raw_html):
+    assert clean_html(raw_html) == reference(raw_html)
+
+
+def test_fuzz_matches_beautifulsoup():
+    rng = random.Random(7)
+    mismatches = []
+    for _ in range(30000):
+        raw_html = "".join(rng.choice(PARTS) for _ in range(rng.randint(0, 12)))
+        if clean_html(raw_html) != reference(raw_html):
+            mismatches.append(raw_html)
+    assert not mismatches, f"{len(mismatches)}개 불일치, 예: {mismatches[:5]!r}"
+
+
+@pytest.mark.parametrize("raw_html, expected", [
+    # 세미콜론 없는/모르는 엔티티는 html.unescape(HTML5) 기준 (BeautifulSoup 과 다름)
+    ("&amp", "&"),
+    ("&#39", "'"),
+    ("&unknown;", "&unknown;"),
+    ("Q&A", "Q&A"),
+    ("AT&T", "AT&T"),
+])
+def test_entities_follow_html5(raw_html, expected):
+    assert clean_html(raw_html) == expected
@@ -0,0 +1,81 @@
+# tests/test_kafka_sink.py
+from shared.kafka_sink import KafkaSink
+
+
+class FakeFuture:
+    def __init__(self, ok: bool = True):
+        self.ok = ok
+
+    def add_callback(self, func):
+        if self.ok:
+            func(None)
+        return self
+
+    def add_errback(self, func):
+        if not self.ok:
+            func(RuntimeError("broker down"))
+        return self
+
+
+class FakeProducer:
+    """send/flush/close 만 있는 브로커 대역 (보낸 메시지를 기록)"""
+
+    def __init__(self, ok: bool = True):
+        self.ok = ok
+        self.sent = []
+        self.flushed = 0
+        self.closed = False
+
+    def send(self, topic, key=None, value=None, headers=None):
+        self.sent.append({"topic": topic, "key": key, "value": value, "headers": headers})
+        return FakeFuture(self.ok)
+
+    def flush(self, timeout=None):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+def article(article_id: str, canonical_id: str = None, topic: str = "main") -> dict:
+    a = {"id": article_id, "topic": topic, "title": f"t{article_id}", "link": f"https://x.com/{article_id}"}
+    if canonical_id:
+        a["canonical_id"] = canonical_id
+    return a
+
+
+def test_key_is_canonical_id():
+    producer = FakeProducer()
+    sink = KafkaSink(producer, topic="articles")
+    # 같은 기사가 두 토픽에서 나오면 (id 는 다름) 같은 key → 같은 파티션
+    sink.write("reuters", [article("a1", "c1", "finance"), article("a2", "c1", "tech")])
+    assert [m["key"] for m in producer.sent] == ["c1", "c1"]
+    assert {m["topic"] for m in producer.sent} == {"articles"}
+    assert producer.sent[0]["value"]["source"] == "reuters"
+    assert producer.sent[0]["headers"] == [("source", b"reuters")]
+    assert sink.stats() == {"sent": 2, "failed": 0}
+
+
+def test_key_falls_back_to_id():
+    producer = FakeProducer()
+    KafkaSink(producer).write("wsj", [article("a1")])
+    assert producer.sent[0]["key"] == "a1"
+
+
+def test_memberships_go_to_membership_topic():
+    producer = FakeProducer()
+    sink = KafkaSink(producer, membership_topic="topics")
+    sink.add_memberships([{"canonical_id": "c1", "scope": "wsj:main", "collected_at": "2024-01-01T00:00:00"}])
+    assert producer.sent == [{
+        "topic": "topics", "key": "c1", "headers": None,
+        "value": {"canonical_id": "c1", "scope": "wsj:main", "collected_at": "2024-01-01T00:00:00"},
+    }]
+
+
+def test_failures_are_counted_and_close_flushes():
+    producer = FakeProducer(ok=False)
+    sink = KafkaSink(producer)
+    sink.write("wsj", [article("a1", "c1")])
+    assert sink.stats() == {"sent": 0, "failed": 1}
+    sink.close()
+    assert producer.flushed == 1 and producer.closed
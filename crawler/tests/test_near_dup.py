@@ -0,0 +1,112 @@
+# tests/test_near_dup.py
+import random
+import pytest
+import fakeredis
+from shared import near_dup
+from shared.near_dup import NearDuplicateIndex, simhash, hamming, BAND_SLICES, MAX_DISTANCE
+from shared.bloom_filter import GENERATION_SECONDS, GENERATIONS
+
+# 제목 + 요약 (filter_articles 가 비교하는 단위, 짧은 글은 단어 하나만 바뀌어도 서명이 크게 달라짐)
+BASE = (
+    "Apple unveils new iPhone with faster chip and longer battery life "
+    "Apple on Tuesday introduced its latest iPhone lineup at its annual product event in Cupertino, California, "
+    "highlighting a faster in-house processor, improved cameras and a battery the company says lasts several hours "
+    "longer than the previous model. Prices start at the same level as last year, and preorders open on Friday "
+    "ahead of a wider release next week."
+)
+# 다른 소스에 실린 같은 기사 (문구 일부 수정 + 출처 표기)
+EDITED = BASE.replace("several hours", "up to four hours") + " Reuters"
+OTHER = (
+    "Central bank raises interest rates by a quarter point as inflation stays above target "
+    "The central bank lifted its benchmark rate by 25 basis points on Wednesday, citing persistent price pressures "
+    "in services and a tight labor market, and signaled that further increases remain possible if inflation does "
+    "not cool in the coming months."
+)
+
+
+@pytest.fixture
+def index(monkeypatch):
+    state = {"healthy": True, "now": 1_700_000_000.0}
+    monkeypatch.setattr(near_dup, "is_healthy", lambda *a: state["healthy"])
+    monkeypatch.setattr(near_dup.time, "time", lambda: state["now"])
+    idx = NearDuplicateIndex()
+    idx.client = fakeredis.FakeRedis(decode_responses=True)
+    return idx, state
+
+
+def test_simhash_needs_enough_tokens():
+    assert simhash("too short to sign") is None
+    assert simhash(BASE) == simhash(BASE.upper() + "!!")  # 대소문자/구두점 무시
+
+
+def test_similar_texts_are_close():
+    assert hamming(simhash(BASE), simhash(EDITED)) <= MAX_DISTANCE
+    assert hamming(simhash(BASE), simhash(OTHER)) > MAX_DISTANCE
+
+
+def test_bands_cover_all_bits():
+    covered = sum(mask << shift for shift, mask in BAND_SLICES)
+    assert covered == (1 << 64) - 1
+
+
+def test_close_signatures_share_a_bucket():
+    # 해밍 거리 MAX_DISTANCE 이하면 (밴드 수 > 거리) 적어도 한 밴드 버킷이 같아야 후보로 잡힘
+    idx = NearDuplicateIndex(key_prefix="t")
+    rng = random.Random(3)
+    for _ in range(2000):
+        sig = rng.getrandbits(64)
+        other = sig
+        for bit in rng.sample(range(64), rng.randint(0, MAX_DISTANCE)):
+            other ^= 1 << bit
+        assert set(idx.bucket_keys(sig, 1)) & set(idx.bucket_keys(other, 1))
+
+
+def test_assigns_stories_across_batches(index):
+    idx, _ = index
+    assert idx.assign_many([("a1", BASE), ("a2", OTHER), ("a3", "short")]) == [
+        ("a1", False), ("a2", False), ("a3", False),
+    ]
+    assert idx.assign_many([("b1", EDITED)]) == [("a1", True)]
+    assert idx.client.smembers(idx.story_key("a1")) == {"b1"}
+
+
+def test_groups_within_one_batch_without_redis(index):
+    idx, state = index
+    state["healthy"] = False
+    assert idx.assign_many([("a1", BASE), ("a2", EDITED), ("a3", OTHER)]) == [
+        ("a1", False), ("a1", True), ("a3", False),
+    ]
+    assert idx.client.keys("*") == []
+
+
+def test_buckets_expire_by_generation(index):
+    idx, state = index
+    idx.assign_many([("a1", BASE)])
+    # 쓰기는 최신 세대 버킷에만, TTL 은 세대 기간 전체
+    keys = idx.client.keys("near_dup:g*")
+    assert len(keys) == len(BAND_SLICES)
+    assert all(k.startswith(f"near_dup:g{idx.generations()[0]}:") for k in keys)
+    assert all(idx.client.ttl(k) > 0 for k in keys)
+
+    state["now"] += GENERATION_SECONDS * (GENERATIONS - 1)
+    assert idx.assign_many([("b1", EDITED)]) == [("a1", True)]  # 오래된 세대도 조회
+
+    state["now"] += GENERATION_SECONDS
+    assert idx.assign_many([("c1", EDITED)]) == [("a1", True)]  # b1 이 최신 세대에 남긴 서명으로 연결
+
+    state["now"] += GENERATION_SECONDS * GENERATIONS
+    assert idx.assign_many([("d1", BASE)]) == [("d1", False)]  # 조회 범위를 벗어남 → 새 스토리
+
+
+def test_filter_articles_drops_copies(index):
+    idx, _ = index
+    title, summary = BASE.split(" Apple on ", 1)
+    articles = [
+        {"id": "a1", "title": title, "summary": "Apple on " + summary},
+        {"id": "a2", "title": EDITED, "summary": ""},
+        {"id": "a3", "title": OTHER, "summary": ""},
+    ]
+    kept, dropped = idx.filter_articles(articles)
+    assert [a["id"] for a in kept] == ["a1", "a3"] and dropped == 1
+    assert [a["story_id"] for a in kept] == ["a1", "a3"]
+    assert idx.filter_articles([]) == ([], 0)
@@ -0,0 +1,173 @@
+# tests/test_pg_loader.py
+import os
+import uuid
+import pytest
+from shared import pg_loader
+from shared.pg_loader import PostgresLoader, COLUMNS, STAGE_TABLE, ARTICLE_TABLE
+
+MIGRATION = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir,
+    "bottlen-webflux", "src", "main", "resources", "db", "migration", "V3__create_crawled_article.sql",
+)
+
+
+def article(article_id: str, title: str = "title", **extra) -> dict:
+    return {
+        "id": article_id, "canonical_id": f"c-{article_id}", "topic": "main", "title": title,
+        "link": f"https://x.com/{article_id}", "summary": "s", "content": "", "author": "",
+        "published": "", "categories": ["a", 1], "collected_at": "2024-01-01T00:00:00", **extra,
+    }
+
+
+# ───────── 연결 대역: COPY 스테이징 흐름 (DB 없이)
+class FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        self.conn.log.append(("execute", " ".join(sql.split())))
+
+    def executemany(self, sql, rows):
+        self.conn.log.append(("executemany", " ".join(sql.split()), list(rows)))
+
+    def copy(self, sql):
+        rows = []
+        self.conn.log.append(("copy", sql, rows))
+        return FakeCopy(rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeTransaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.log.append(("begin",))
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.log.append(("rollback",) if exc_type else ("commit",))
+        return False
+
+
+class FakeConnection:
+    closed = False
+
+    def __init__(self):
+        self.log = []
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+def test_batch_is_copied_to_stage_then_upserted_in_one_transaction():
+    loader = PostgresLoader("unused")
+    loader._conn = conn = FakeConnection()
+
+    assert loader.upsert_many("wsj", [article("a1"), {"title": "no id"}, article("a2")]) == 2
+
+    steps = [entry[0] for entry in conn.log]
+    assert steps == ["begin", "execute", "copy", "execute", "commit"]
+    assert conn.log[1][1].startswith(f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE}")
+    assert conn.log[2][1] == f"COPY {STAGE_TABLE} ({', '.join(COLUMNS)}) FROM STDIN"
+    assert conn.log[3][1].startswith(f"INSERT INTO {ARTICLE_TABLE}")
+    assert "ON CONFLICT (id) DO UPDATE" in conn.log[3][1]
+
+    rows = conn.log[2][2]
+    assert [r[0] for r in rows] == ["a1", "a2"]
+    first = dict(zip(COLUMNS, rows[0]))
+    assert first["source"] == "wsj" and first["canonical_id"] == "c-a1"
+    assert first["categories"] == ["a", "1"]
+    assert first["author"] is None and first["published"] is None  # 빈 문자열 → NULL
+
+
+def test_failed_batch_drops_connection():
+    loader = PostgresLoader("unused")
+    loader._conn = conn = FakeConnection()
+    conn.cursor = lambda: (_ for _ in ()).throw(RuntimeError("connection lost"))
+    with pytest.raises(RuntimeError):
+        loader.upsert_many("wsj", [article("a1")])
+    assert loader._conn is None and conn.closed
+
+
+def test_empty_batch_does_not_connect():
+    loader = PostgresLoader("unused")
+    assert loader.upsert_many("wsj", []) == 0
+    assert loader.add_memberships([]) == 0
+    assert loader._conn is None
+
+
+# ───────── 로컬 Postgres (POSTGRES_TEST_DSN 이 있을 때만, 임시 스키마에 마이그레이션 적용)
+@pytest.fixture
+def pg():
+    dsn = os.getenv("POSTGRES_TEST_DSN")
+    if not dsn:
+        pytest.skip("POSTGRES_TEST_DSN 미설정")
+    psycopg = pytest.importorskip("psycopg")
+    schema = f"crawler_test_{uuid.uuid4().hex[:8]}"
+    admin = psycopg.connect(dsn, autocommit=True)
+    admin.execute(f"CREATE SCHEMA {schema}")
+    try:
+        conn = psycopg.connect(dsn, autocommit=True, options=f"-c search_path={schema}")
+        with open(MIGRATION, "r", encoding="utf-8") as f:
+            with conn.transaction():
+                conn.execute(f.read())
+        loader = PostgresLoader(dsn)
+        loader._conn = conn
+        yield loader, conn
+        loader.close()
+    finally:
+        admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def count(conn, table: str) -> int:
+    return conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+
+def test_upsert_is_idempotent(pg):
+    loader, conn = pg
+    batch = [article("a1"), article("a2")]
+    loader.upsert_many("wsj", batch)
+    loader.upsert_many("wsj", batch)
+    assert count(conn, ARTICLE_TABLE) == 2
+
+    # 같은 id 를 다시 적재하면 갱신 (같은 배치 안 중복은 마지막 것)
+    loader.upsert_many("wsj", [article("a1", "old"), article("a1", "new")])
+    assert count(conn, ARTICLE_TABLE) == 2
+    assert conn.execute(f"SELECT title FROM {ARTICLE_TABLE} WHERE id = 'a1'").fetchone()[0] == "new"
+    # 임시 테이블은 커밋마다 비워짐
+    assert count(conn, STAGE_TABLE) == 0
+
+
+def test_memberships_are_idempotent(pg):
+    loader, conn = pg
+    records = [{"canonical_id": "c1", "scope": "wsj:main", "collected_at": "2024-01-01T00:00:00"},
+               {"canonical_id": "c1", "scope": "reuters:finance", "collected_at": "2024-01-01T00:00:00"}]
+    loader.add_memberships(records)
+    loader.add_memberships(records)
+    assert count(conn, pg_loader.TOPIC_TABLE) == 2
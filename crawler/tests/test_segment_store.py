@@ -0,0 +1,129 @@
+# tests/test_segment_store.py
+import os
+import sys
+import json
+import subprocess
+import pytest
+from shared import segment_store
+from shared.segment_store import SegmentWriter, SegmentStore, OPEN_SUFFIX, DONE_SUFFIX
+
+
+def records(n: int, start: int = 0) -> list:
+    return [{"id": f"a{i}", "title": f"제목 {i}"} for i in range(start, start + n)]
+
+
+def files(stream_dir, suffix: str) -> list:
+    return sorted(name for name in os.listdir(stream_dir) if name.endswith(suffix))
+
+
+def read_done(stream_dir) -> list:
+    rows = []
+    for name in files(stream_dir, DONE_SUFFIX):
+        with open(os.path.join(stream_dir, name), "r", encoding="utf-8") as f:
+            rows += [json.loads(line) for line in f]
+    return rows
+
+
+@pytest.fixture(scope="module")
+def dead_pid() -> int:
+    """이미 종료된 프로세스의 pid"""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def write_part(stream_dir, pid: int, lines: list, tail: bytes = b"", seq: int = 0) -> str:
+    os.makedirs(stream_dir, exist_ok=True)
+    path = os.path.join(stream_dir, f"20240101-000000-{pid}-{seq:06d}{OPEN_SUFFIX}")
+    with open(path, "wb") as f:
+        for r in lines:
+            f.write(json.dumps(r, ensure_ascii=False).encode("utf-8") + b"\n")
+        f.write(tail)
+    return path
+
+
+def test_append_and_close(tmp_path):
+    writer = SegmentWriter(str(tmp_path))
+    writer.append(records(2))
+    writer.append(records(1, 2))
+    assert files(tmp_path, OPEN_SUFFIX) and not files(tmp_path, DONE_SUFFIX)
+    writer.close()
+    assert not files(tmp_path, OPEN_SUFFIX)
+    assert read_done(tmp_path) == records(3)
+
+
+def test_roll_by_size(tmp_path):
+    writer = SegmentWriter(str(tmp_path), max_bytes=1)
+    for i in range(3):
+        writer.append(records(1, i))
+    writer.close()
+    assert len(files(tmp_path, DONE_SUFFIX)) == 3
+    assert read_done(tmp_path) == records(3)
+
+
+def test_roll_by_age(tmp_path, monkeypatch):
+    writer = SegmentWriter(str(tmp_path), max_age=60)
+    writer.append(records(1))
+    writer.roll_if_expired()
+    assert not files(tmp_path, DONE_SUFFIX)
+
+    now = segment_store.time.time()
+    monkeypatch.setattr(segment_store.time, "time", lambda: now + 61)
+    writer.roll_if_expired()
+    assert files(tmp_path, DONE_SUFFIX) and not files(tmp_path, OPEN_SUFFIX)
+
+
+def test_recover_truncated_segment(tmp_path, dead_pid):
+    # 쓰는 중 죽은 프로세스: 마지막 줄이 잘린 .part → 완전한 줄까지만 .jsonl 로
+    write_part(tmp_path, dead_pid, records(2), tail=b'{"id":"a2","tit')
+    SegmentWriter(str(tmp_path))
+    assert not files(tmp_path, OPEN_SUFFIX)
+    assert read_done(tmp_path) == records(2)
+
+
+def test_recover_segment_with_only_partial_line(tmp_path, dead_pid):
+    write_part(tmp_path, dead_pid, [], tail=b'{"id":"a0"')
+    write_part(tmp_path, dead_pid, [], seq=1)
+    SegmentWriter(str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_recover_partial_line_longer_than_scan_chunk(tmp_path, dead_pid):
+    write_part(tmp_path, dead_pid, records(1), tail=b"x" * 200_000)
+    SegmentWriter(str(tmp_path))
+    assert read_done(tmp_path) == records(1)
+
+
+def test_recover_skips_live_writers(tmp_path, dead_pid):
+    # 다른 프로세스(살아 있는 부모)가 쓰는 중인 .part 는 그대로
+    live = write_part(tmp_path, os.getppid(), records(1), tail=b'{"id"')
+    write_part(tmp_path, dead_pid, records(1), seq=1)
+    own = write_part(tmp_path, os.getpid(), records(1), seq=2)  # pid 를 재사용한 이전 실행
+
+    SegmentWriter(str(tmp_path))
+    assert files(tmp_path, OPEN_SUFFIX) == [os.path.basename(live)]
+    assert not os.path.exists(own)
+    assert len(files(tmp_path, DONE_SUFFIX)) == 2
+
+
+def test_recovered_and_new_records_are_kept(tmp_path, dead_pid):
+    write_part(tmp_path, dead_pid, records(2), tail=b"{")
+    writer = SegmentWriter(str(tmp_path))
+    writer.append(records(1, 2))
+    writer.close()
+    assert sorted(r["id"] for r in read_done(tmp_path)) == ["a0", "a1", "a2"]
+
+
+def test_store_limits_open_files(tmp_path):
+    store = SegmentStore(max_open=2)
+    try:
+        for i in range(4):
+            store.append(records(1, i), str(tmp_path / f"topic{i}"))
+        open_files = [w for w in store._writers.values() if w._file is not None]
+        assert len(open_files) == 2
+        # 닫힌 스트림에 다시 쓰면 같은 세그먼트에 이어 씀
+        store.append(records(1, 10), str(tmp_path / "topic0"))
+    finally:
+        store.close_all()
+    assert read_done(tmp_path / "topic0") == records(1) + records(1, 10)
+    assert store.append([], str(tmp_path / "topic0")) == 0
@@ -0,0 +1,55 @@
+# tests/test_url_normalizer.py
+import pytest
+from shared.url_normalizer import UrlNormalizer, CONFIG_PATH, url_key
+
+# 저장소의 실제 규칙 파일로 테스트 (규칙을 바꾸면 여기서 확인)
+normalizer = UrlNormalizer.from_config(CONFIG_PATH)
+
+
+@pytest.mark.parametrize("url, expected", [
+    # scheme/host 소문자, 기본 포트·fragment 제거, 남은 파라미터 정렬
+    ("HTTPS://Example.COM:443/a?b=2&a=1#top", "https://example.com/a?a=1&b=2"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("https://example.com", "https://example.com/"),
+    # 전역 추적 파라미터
+    ("https://example.com/a?utm_source=rss&utm_medium=x&id=3", "https://example.com/a?id=3"),
+    ("https://example.com/a?fbclid=1&gclid=2&guce_referrer=3", "https://example.com/a"),
+    # 일반적인 이름은 호스트 규칙이 없으면 그대로 (기사를 고르는 파라미터일 수 있음)
+    ("https://example.com/view?src=12&ref=3&tc=4&cmp=5&rss=6&mod=7", "https://example.com/view?cmp=5&mod=7&ref=3&rss=6&src=12&tc=4"),
+    # 호스트 규칙 (하위 도메인 포함)
+    ("https://www.marketwatch.com/story/x?mod=mw_rss_topstories", "https://www.marketwatch.com/story/x"),
+    ("https://news.yahoo.com/x.html?src=rss&ncid=y", "https://news.yahoo.com/x.html"),
+    ("https://www.nytimes.com/2024/x.html?smid=tw-share", "https://www.nytimes.com/2024/x.html"),
+    ("https://www.wsj.com/articles/x?mod=rss_markets&st=1", "https://www.wsj.com/articles/x"),
+    ("https://news.google.com/rss/articles/CBMi?oc=5&hl=en", "https://news.google.com/rss/articles/CBMi"),
+    # path 규칙
+    ("https://example.com/story/amp/", "https://example.com/story"),
+    # 잘못된 포트/주소는 예외 없이 그대로
+    ("http://x.com:abc/a", "http://x.com:abc/a"),
+    ("http://[::1/a", "http://[::1/a"),
+    # http(s) 가 아니거나 호스트가 없으면 그대로
+    ("mailto:a@b.com", "mailto:a@b.com"),
+    ("/relative/path", "/relative/path"),
+])
+def test_normalize(url, expected):
+    assert normalizer.normalize(url) == expected
+
+
+@pytest.mark.parametrize("a, b", [
+    ("http://www.wsj.com/articles/x/?mod=rss", "https://wsj.com/articles/x"),
+    ("https://example.com/a/?utm_source=x", "http://www.example.com/a"),
+    ("https://example.com/a?b=2&a=1", "https://example.com/a?a=1&b=2"),
+])
+def test_url_key_ignores_cosmetic_differences(a, b):
+    assert url_key(a) == url_key(b)
+
+
+def test_url_key_keeps_distinct_articles():
+    assert url_key("https://example.com/view?id=1") != url_key("https://example.com/view?id=2")
+    assert url_key("https://example.com/view?src=1") != url_key("https://example.com/view?src=2")
+
+
+def test_host_override_extends_default():
+    n = UrlNormalizer({"a.com": {"drop_params": ["x"]}}, {"drop_params": ["utm_.*"]})
+    assert n.normalize("https://sub.a.com/p?x=1&utm_source=2&y=3") == "https://sub.a.com/p?y=3"
+    assert n.normalize("https://b.com/p?x=1&utm_source=2") == "https://b.com/p?x=1"